@@ -231,6 +231,8 @@ def encode_complex_string(string_val: str, max_size: int | None = None,
     preferred_encoding = preferred_encoding or pluginEncoding
     bytes_val = encode(to_win_newlines(string_val.rstrip()),
         firstEncoding=preferred_encoding)
+    if max_size is None and min_size is None:
+        return bytes_val # The vast majority of strings
     if max_size is not None:
         bytes_val = bytes_val[:max_size]
     if min_size is not None and (num_nulls := min_size - len(bytes_val)) > 0:
@@ -275,7 +277,9 @@ def to_unix_newlines(s: str) -> str:
 
 def to_win_newlines(s):
     """Converts LF (Unix) newlines to CR-LF (Windows) newlines."""
-    return reUnixNewLine.sub('\r\n', s)
+    # Most strings (e.g. every record string we dump) contain no newlines at
+    # all - skip the regex for those
+    return reUnixNewLine.sub('\r\n', s) if '\n' in s else s
 
 def remove_newlines(s: str) -> str:
     """Removes all newlines (whether they are in LF, CR-LF or CR form) from the
@@ -2220,6 +2224,12 @@ def __repr__(self):
     def __str__(self):
         return f'{round(self, 6):.6f}'  # for writing out in csv
 
+    def __deepcopy__(self, memodict={}):
+        return self # immutable
+
+    def __copy__(self):
+        return self # immutable
+
     # Action API --------------------------------------------------------------
     def dump(self): return self  ##: TODO round?
 
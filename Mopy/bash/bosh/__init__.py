@@ -478,14 +478,16 @@ def set_plugin_flags(self, flags_dict: dict[PluginFlag, bool | None],
 
     def _scan_fids(self, fid_cond):
         with ModReader.from_info(self) as ins:
+            ins_at_end = ins.atEnd
+            ins_seek = ins.seek
             try:
-                while not ins.atEnd():
+                while not ins_at_end():
                     next_header = unpack_header(ins)
                     # Skip GRUPs themselves, only process their records
-                    if next_header.recType != b'GRUP':
+                    if (rsig := next_header.recType) != b'GRUP':
                         if fid_cond(next_header.fid):
                             return True
-                        next_header.skip_blob(ins)
+                        ins_seek(next_header.blob_size, 1, rsig)
             except (OSError, struct_error) as e:
                 raise ModError(ins.inName, f"Error scanning {self}, file read "
                     f"pos: {ins.tell():d}\nCaused by: '{e!r}'")
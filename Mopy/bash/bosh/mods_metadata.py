@@ -23,12 +23,13 @@
 from __future__ import annotations
 
 import io
+import re
 from collections import Counter, defaultdict
 
 from .. import bass, bolt, bush, load_order, initialization
 from ..bolt import SubProgress, dict_sort, sig_to_str, structs_cache
 from ..brec import ModReader, RecordHeader, RecordType, ShortFidWriteContext, \
-    SubrecordBlob, unpack_header
+    Subrecord, unpack_header
 from ..exception import CancelError
 from ..plugin_types import MergeabilityCheck
 from ..mod_files import ModHeaderReader
@@ -97,6 +98,11 @@ def read_loot_tags(plugin_name):
     return process_tags(added_tags), process_tags(deleted_tags)
 
 # BashTags dir ----------------------------------------------------------------
+# Comments run until the end of the line, tags are separated by commas and/or
+# newlines
+_tag_comment_re = re.compile('#.*')
+_tag_separator_re = re.compile('[,\n]')
+
 def get_tags_from_dir(plugin_name, ci_cached_bt_contents=None):
     """Retrieves a tuple containing a set of added and a set of deleted
     tags from the 'Data/BashTags/PLUGIN_NAME.txt' file, if it is
@@ -125,20 +131,18 @@ def get_tags_from_dir(plugin_name, ci_cached_bt_contents=None):
     add_added = added.add
     # BashTags files must be in UTF-8 (or ASCII, obviously)
     with tag_file.open(u'r', encoding=u'utf-8') as ins:
-        for tag_line in ins:
-            # Strip out comments and skip lines that are empty as a result
-            tag_line = tag_line.split(u'#')[0].strip()
-            if not tag_line: continue
-            for tag_entry in tag_line.split(u','):
-                # Guard against things (e.g. typos) like 'TagA,,TagB'
-                if not tag_entry: continue
-                tag_entry = tag_entry.strip()
-                # If it starts with a minus, it's removing a tag
-                if tag_entry[0] == u'-':
-                    # Guard against a typo like '- C.Water'
-                    add_removed(tag_entry[1:].strip())
-                else:
-                    add_added(tag_entry)
+        # Strip out all comments at once, then split the rest into tags
+        tag_data = _tag_comment_re.sub('', ins.read())
+    for tag_entry in _tag_separator_re.split(tag_data):
+        # Guard against things (e.g. typos) like 'TagA,,TagB' and skip lines
+        # that were empty or only contained a comment
+        if not (tag_entry := tag_entry.strip()): continue
+        # If it starts with a minus, it's removing a tag
+        if tag_entry[0] == u'-':
+            # Guard against a typo like '- C.Water'
+            add_removed(tag_entry[1:].strip())
+        else:
+            add_added(tag_entry)
     return added, removed
 
 def save_tags_to_dir(plugin_name, plugin_tag_diff):
@@ -153,10 +157,12 @@ def save_tags_to_dir(plugin_name, plugin_tag_diff):
     tag_files_dir = bass.dirs['tag_files']
     tag_files_dir.makedirs()
     tag_file = tag_files_dir.join(f'{plugin_name.fn_body}.txt')
-    # Calculate the diff and ignore the minus when sorting the result
+    # Calculate the diff and ignore the minus when sorting the result - we
+    # know which tags are removed ones, so pair each tag with its sort key
+    # up front instead of checking for the minus during the sort
     tag_diff_add, tag_diff_del = plugin_tag_diff
-    processed_diff = sorted(tag_diff_add | {f'-{t}' for t in tag_diff_del},
-                            key=lambda t: t[1:] if t[0] == '-' else t)
+    processed_diff = sorted([(t, t) for t in tag_diff_add] +
+                            [(t, f'-{t}') for t in tag_diff_del])
     # While all our tags are ASCII, the comment at the top can be localized, so
     # use UTF-8
     with tag_file.open('w', encoding='utf-8') as out:
@@ -164,7 +170,7 @@ def save_tags_to_dir(plugin_name, plugin_tag_diff):
         # Also print the version, which could be helpful
         out.write(f"# {_('Generated by Wrye Bash %(wb_version)s')}\n" % {
             'wb_version': bass.AppVersion})
-        out.write(', '.join(processed_diff) + '\n')
+        out.write(', '.join(t for _sort_key, t in processed_diff) + '\n')
 
 def diff_tags(plugin_new_tags, plugin_old_tags):
     """Returns two sets, the first containing all added tags and the second all
@@ -201,93 +207,92 @@ def checkMods(progress, modInfos, showModList=False, showCRC=False,
     # Check for corrupt plugins
     all_corrupted = modInfos.corrupted
     # -------------------------------------------------------------------------
-    # Check for ESL-flagged plugins that aren't ESL-capable and Overlay-flagged
-    # plugins that shouldn't be Overlay-flagged. Also check for conflicts
-    # between ESL and Overlay flags.
+    # Run all per-plugin checks that only need the plugin's header and metadata
+    # in a single pass over the load order:
+    # - ESL-flagged plugins that aren't ESL-capable and Overlay-flagged plugins
+    #   that shouldn't be Overlay-flagged. Also conflicts between ESL and
+    #   Overlay flags.
     pflags = bush.game.plugin_flags
-    if flag_errors := {k: {h_msg: set() for h_msg in v} for k, v in
-                       pflags.error_msgs.items()}:
-        for m, modinf in modInfos.items():
-            for pflag in flag_errors:
-                if pflag.cached_type(modinf):
-                    pflag.validate_type(modinf, flag_errors[pflag].values())
-    # -------------------------------------------------------------------------
-    # Check for Deactivate-tagged plugins that are active and
-    # MustBeActiveIfImported-tagged plugins that are imported, but inactive.
+    flag_errors = {k: {h_msg: set() for h_msg in v} for k, v in
+                   pflags.error_msgs.items()}
+    flag_checks = [(pflag, pflag_errs.values()) for pflag, pflag_errs in
+                   flag_errors.items()]
+    # - Deactivate-tagged plugins that are active and
+    #   MustBeActiveIfImported-tagged plugins that are imported, but inactive.
     should_deactivate = []
     should_activate = []
-    for plugin_fn, p_minf in all_present_minfs.items():
-        p_active = plugin_fn in all_active_plugins
-        p_imported = plugin_fn in modInfos.imported
-        p_tags = p_minf.getBashTags()
-        if u'Deactivate' in p_tags and p_active:
-            should_deactivate.append(plugin_fn)
-        if u'MustBeActiveIfImported' in p_tags and not p_active and p_imported:
-            should_activate.append(plugin_fn)
-    # -------------------------------------------------------------------------
-    # Check for missing or delinquent masters
+    imported_plugins = modInfos.imported
+    # Cache the tags, we need them again when checking for NoMerge below
+    all_plugin_tags = {}
+    # - Missing, delinquent or circular masters
     seen_plugins = set()
     cannot_scan_overrides = set()
     p_missing_masters = set()
     p_delinquent_masters = set()
     p_circular_masters = set()
-    for p_fn_key, p in all_present_minfs.items():
-        if p.has_circular_masters():
+    # - Plugins with invalid TES4 version
+    valid_vers = frozenset(bush.game.Esp.validHeaderVersions)
+    invalid_tes4_versions = {}
+    # - Cleaning information from LOOT
+    cleaning_messages = {}
+    scan_for_cleaning = set()
+    num_dirty_vanilla = 0
+    for plugin_fn, p_minf in all_present_minfs.items():
+        for pflag, pflag_errs in flag_checks:
+            if pflag.cached_type(p_minf):
+                pflag.validate_type(p_minf, pflag_errs)
+        p_active = plugin_fn in all_active_plugins
+        all_plugin_tags[plugin_fn] = p_tags = p_minf.getBashTags()
+        if u'Deactivate' in p_tags and p_active:
+            should_deactivate.append(plugin_fn)
+        if (u'MustBeActiveIfImported' in p_tags and not p_active and
+                plugin_fn in imported_plugins):
+            should_activate.append(plugin_fn)
+        if p_minf.has_circular_masters():
             # The plugin depends on itself (possibly transitively) -> report
-            p_circular_masters.add(p_fn_key)
-        if p_fn_key in all_active_plugins:
-            for p_master in p.masterNames:
+            p_circular_masters.add(plugin_fn)
+        if p_active:
+            for p_master in p_minf.masterNames:
                 if p_master not in all_present_plugins:
                     # The plugin is active and a master is missing -> report
-                    p_missing_masters.add(p_fn_key)
+                    p_missing_masters.add(plugin_fn)
                 else:
                     if p_master not in seen_plugins:
                         # The plugin is active and one of its masters hasn't
                         # been checked, so that master is delinquent -> report
-                        p_delinquent_masters.add(p_fn_key)
+                        p_delinquent_masters.add(plugin_fn)
                     if p_master not in all_active_plugins:
                         # Inactive master -> needed for scanning later
-                        cannot_scan_overrides.add(p_fn_key)
+                        cannot_scan_overrides.add(plugin_fn)
+            if (p_ver := p_minf.header.version) not in valid_vers:
+                invalid_tes4_versions[plugin_fn] = f'{p_ver}'
         else:
-            for p_master in p.masterNames:
+            for p_master in p_minf.masterNames:
                 if p_master not in all_active_plugins:
                     # Inactive master -> needed for scanning later
-                    cannot_scan_overrides.add(p_fn_key)
-        seen_plugins.add(p_fn_key)
+                    cannot_scan_overrides.add(plugin_fn)
+        seen_plugins.add(plugin_fn)
+        if y := p_minf.getDirtyMessage(scan_beth=True):
+            if isinstance(y, str):
+                cleaning_messages[plugin_fn] = y
+            else: # Don't report vanilla plugins if the ignore setting is on
+                num_dirty_vanilla += 1
+        elif scan_plugins:
+            scan_for_cleaning.add(plugin_fn)
     cannot_scan_overrides |= p_missing_masters
     # -------------------------------------------------------------------------
-    # Check for plugins with invalid TES4 version.
-    valid_vers = bush.game.Esp.validHeaderVersions
-    invalid_tes4_versions = {
-        p: f'{p_ver}' for p in all_active_plugins
-        if (p_ver := modInfos[p].header.version) not in valid_vers}
-    # -------------------------------------------------------------------------
     # Check for older form versions, which may point to improperly converted
     # plugins
     old_fvers = modInfos.older_form_versions
     # -------------------------------------------------------------------------
-    # Check for cleaning information from LOOT.
-    cleaning_messages = {}
-    scan_for_cleaning = set()
-    dirty_msgs = [(k, m.getDirtyMessage(scan_beth=True)) for k, m in
-                  all_present_minfs.items()]
-    num_dirty_vanilla = 0
-    for x, y in dirty_msgs:
-        if y:
-            if isinstance(y, str):
-                cleaning_messages[x] = y
-            else: # Don't report vanilla plugins if the ignore setting is on
-                num_dirty_vanilla += 1
-        elif scan_plugins:
-            scan_for_cleaning.add(x)
-    # -------------------------------------------------------------------------
     # Scan plugins to collect data for more detailed analysis.
     scanning_canceled = False
     all_unneeded_deletions = defaultdict(list) # fn_key -> list[(fid, sig)]
-    all_deleted_refs = defaultdict(list) # fn_key -> list[fid]
-    all_deleted_navms = defaultdict(list) # fn_key -> list[fid]
-    all_deleted_others = defaultdict(list) # fn_key -> list[fid]
-    old_weapon_records = defaultdict(list) # fn_key -> list[fid]
+    # We only ever report how many of these there are, so just count them
+    all_deleted_refs = Counter() # fn_key -> int
+    all_deleted_navms = Counter() # fn_key -> int
+    all_deleted_others = Counter() # fn_key -> int
+    old_weapon_records = Counter() # fn_key -> int
     null_formid_records = defaultdict(list) # fn_key -> list[(eid, sig)]
     plgn_header_sig = bush.game.Esp.plugin_header_sig
     # fid -> (is_injected, orig_plugin, list[(eid, sig, plugin)])
@@ -295,32 +300,25 @@ def checkMods(progress, modInfos, showModList=False, showCRC=False,
     # fid -> (orig_plugin, list[(eid, sig, plugin)])
     probable_injected_collisions = {}
     duplicate_formids = defaultdict(dict) # fid -> plugin -> int
-    all_hitmes = defaultdict(list) # fn_key -> list[fid]
+    all_hitmes = Counter() # fn_key -> int
     if scan_plugins:
         try:
             # Extract data for all plugins (we'll need the context from all of
-            # them, even the game master)
-            load_progress = SubProgress(progress, 0, 0.7)
+            # them, even the game master) and run over each plugin's data
+            # right away, collecting information such as deleted records and
+            # overrides - that way we only hold one plugin's data at a time
+            load_progress = SubProgress(progress, 0, 0.9)
             load_progress.setFull(len(all_present_minfs))
-            all_extracted_data = {}
-            for i, (k, present_minf) in enumerate(all_present_minfs.items()):
-                mod_progress = SubProgress(load_progress, i, i + 1)
-                ext_data = ModHeaderReader.extract_mod_data(present_minf,
-                                                            mod_progress)
-                all_extracted_data[k] = ext_data
-            # Run over all plugin data once for efficiency, collecting
-            # information such as deleted records and overrides
-            scan_progress = SubProgress(progress, 0.7, 0.9)
-            scan_progress.setFull(len(all_extracted_data))
             all_ref_types = RecordType.sig_to_class[b'CELL'].ref_types
             # Temporary place to collect (eid, sig, plugin)-lists
             all_record_versions: dict[int, list] = defaultdict(list)
             # Whether or not the game uses SSE's form version (44)
             game_has_v44 = RecordHeader.plugin_form_version == 44
-            for i, (plugin_fn, ext_data) in enumerate(
-                    all_extracted_data.items()):
-                scan_progress(i, _('Scanning: %(scanning_plugin)s') % {
-                    'scanning_plugin': plugin_fn})
+            for i, (plugin_fn, present_minf) in enumerate(
+                    all_present_minfs.items()):
+                mod_progress = SubProgress(load_progress, i, i + 1)
+                ext_data = ModHeaderReader.extract_mod_data(present_minf,
+                                                            mod_progress)
                 # Two situations where we can skip checking deleted records:
                 # 1. The game master can't have deleted records (deleting a
                 #    record from the master file that introduced it just
@@ -345,20 +343,15 @@ def checkMods(progress, modInfos, showModList=False, showCRC=False,
                 scan_old_weapons = (game_has_v44 and
                                     plugin_fn not in vanilla_masters)
                 add_unneeded_del = all_unneeded_deletions[plugin_fn].append
-                add_deleted_ref = all_deleted_refs[plugin_fn].append
-                add_deleted_navm = all_deleted_navms[plugin_fn].append
-                add_deleted_rec = all_deleted_others[plugin_fn].append
-                add_old_weapon = old_weapon_records[plugin_fn].append
-                add_hitme = all_hitmes[plugin_fn].append
                 add_null_fid = null_formid_records[plugin_fn].append
-                p_masters = (*modInfos[plugin_fn].masterNames, plugin_fn)
+                p_masters = (*present_minf.masterNames, plugin_fn)
                 p_num_masters = len(p_masters)
                 for r, d in ext_data.items():
                     for r_header, r_eid in d:
                         r_fid = r_header.fid
+                        r_obj_dex = r_fid.object_dex
                         w_rec_type = r_header.recType
-                        if (r_fid.object_dex == 0 and
-                                w_rec_type != plgn_header_sig):
+                        if r_obj_dex == 0 and w_rec_type != plgn_header_sig:
                             add_null_fid((w_rec_type, r_eid))
                         r_mod_index = r_fid.mod_dex
                         if scan_deleted:
@@ -368,27 +361,27 @@ def checkMods(progress, modInfos, showModList=False, showCRC=False,
                                 if r_mod_index == p_num_masters - 1:
                                     add_unneeded_del((r_fid, w_rec_type))
                                 elif w_rec_type == b'NAVM':
-                                    add_deleted_navm(r_fid)
+                                    all_deleted_navms[plugin_fn] += 1
                                 elif w_rec_type in all_ref_types:
-                                    add_deleted_ref(r_fid)
+                                    all_deleted_refs[plugin_fn] += 1
                                 else:
-                                    add_deleted_rec(r_fid)
+                                    all_deleted_others[plugin_fn] += 1
                         # p_masters includes self, so >=
                         is_hitme = r_mod_index >= p_num_masters
                         if is_hitme:
-                            add_hitme(r_fid)
+                            all_hitmes[plugin_fn] += 1
                         if scan_overrides:
                             # Convert into a load order FormID - ugly but fast,
                             # inlined and hand-optimized from various methods.
                             # Calling them would be way too slow.
-                            lo_fid = (r_fid.object_dex | plugin_to_acti_index[
+                            lo_fid = (r_obj_dex | plugin_to_acti_index[
                                 p_masters[p_num_masters - 1 if is_hitme else
                                 r_mod_index]] << 24)
                             all_record_versions[lo_fid].append(
-                                (r_eid, r_header.recType, plugin_fn))
+                                (r_eid, w_rec_type, plugin_fn))
                         if (scan_old_weapons and w_rec_type == b'WEAP' and
                                 r_header.form_version < 44):
-                            add_old_weapon(r_fid)
+                            old_weapon_records[plugin_fn] += 1
             # Check for record type collisions, i.e. overrides where the record
             # type of at least one override does not match the base record's
             # type and probable injected collisions, i.e. injected records
@@ -457,72 +450,71 @@ def checkMods(progress, modInfos, showModList=False, showCRC=False,
     # -------------------------------------------------------------------------
     # Check for deleted references
     if all_deleted_refs:
-        for plugin_fn, deleted_refrs in all_deleted_refs.items():
+        one_del_msg = _('1 deleted reference')
+        many_del_msg = _('%(num_del_refs)d deleted references')
+        for plugin_fn, num_deleted in all_deleted_refs.items():
             # Rely on LOOT for detecting deleted references in vanilla files
             plugin_is_vanilla = plugin_fn in vanilla_masters
             # .esu files created by xEdit use deleted records on purpose to
             # mark records that exist in one plugin but not in the other
             plugin_is_esu = plugin_fn.fn_ext == '.esu'
-            if deleted_refrs and not plugin_is_vanilla and not plugin_is_esu:
-                num_deleted = len(deleted_refrs)
+            if not plugin_is_vanilla and not plugin_is_esu:
                 if num_deleted == 1: # I hate natural languages :/
-                    del_msg = _('1 deleted reference')
+                    del_msg = one_del_msg
                 else:
-                    del_msg = _('%(num_del_refs)d deleted references') % {
-                        'num_del_refs': num_deleted}
+                    del_msg = many_del_msg % {'num_del_refs': num_deleted}
                 cleaning_messages[plugin_fn] = del_msg
     # -------------------------------------------------------------------------
     # Check for deleted navmeshes
     deleted_navmeshes = {}
     if all_deleted_navms:
-        for plugin_fn, deleted_navms in all_deleted_navms.items():
+        one_del_msg = _('1 deleted navmesh')
+        many_del_msg = _('%(num_del_navms)d deleted navmeshes')
+        for plugin_fn, num_deleted in all_deleted_navms.items():
             # Deleted navmeshes can't and shouldn't be fixed in vanilla files,
             # so don't show warnings for them
             plugin_is_vanilla = plugin_fn in vanilla_masters
             # .esu files created by xEdit use deleted records on purpose to
             # mark records that exist in one plugin but not in the other
             plugin_is_esu = plugin_fn.fn_ext == '.esu'
-            if deleted_navms and not plugin_is_vanilla and not plugin_is_esu:
-                num_deleted = len(deleted_navms)
+            if not plugin_is_vanilla and not plugin_is_esu:
                 if num_deleted == 1:
-                    del_msg = _('1 deleted navmesh')
+                    del_msg = one_del_msg
                 else:
-                    del_msg = _('%(num_del_navms)d deleted navmeshes') % {
-                        'num_del_navms': num_deleted}
+                    del_msg = many_del_msg % {'num_del_navms': num_deleted}
                 deleted_navmeshes[plugin_fn] = del_msg
     # -------------------------------------------------------------------------
     # Check for deleted base records
     deleted_base_recs = {}
     if all_deleted_others:
-        for plugin_fn, deleted_others in all_deleted_others.items():
+        one_del_msg = _('1 deleted base record')
+        many_del_msg = _('%(num_del_bases)d deleted base records')
+        for plugin_fn, num_deleted in all_deleted_others.items():
             # Deleted navmeshes can't and shouldn't be fixed in vanilla files,
             # so don't show warnings for them
             plugin_is_vanilla = plugin_fn in vanilla_masters
             # .esu files created by xEdit use deleted records on purpose to
             # mark records that exist in one plugin but not in the other
             plugin_is_esu = plugin_fn.fn_ext == '.esu'
-            if deleted_others and not plugin_is_vanilla and not plugin_is_esu:
-                num_deleted = len(deleted_others)
+            if not plugin_is_vanilla and not plugin_is_esu:
                 if num_deleted == 1:
-                    del_msg = _('1 deleted base record')
+                    del_msg = one_del_msg
                 else:
-                    del_msg = _('%(num_del_bases)d deleted base records') % {
-                        'num_del_bases': num_deleted}
+                    del_msg = many_del_msg % {'num_del_bases': num_deleted}
                 deleted_base_recs[plugin_fn] = del_msg
     # -------------------------------------------------------------------------
     # Check for old (form version < 44) WEAP records, which the game can't load
     # properly and which cannot be converted safely by the CK
     old_weaps = {}
     if old_weapon_records:
-        for plugin_fn, weap_recs in old_weapon_records.items():
-            if weap_recs:
-                num_weaps = len(weap_recs)
-                if num_weaps == 1:
-                    weap_msg = _('1 old weapon record')
-                else:
-                    weap_msg = _('%(num_old_weaps)d old weapon records') % {
-                        'num_old_weaps': num_weaps}
-                old_weaps[plugin_fn] = weap_msg
+        one_weap_msg = _('1 old weapon record')
+        many_weap_msg = _('%(num_old_weaps)d old weapon records')
+        for plugin_fn, num_weaps in old_weapon_records.items():
+            if num_weaps == 1:
+                weap_msg = one_weap_msg
+            else:
+                weap_msg = many_weap_msg % {'num_old_weaps': num_weaps}
+            old_weaps[plugin_fn] = weap_msg
     # -------------------------------------------------------------------------
     # Check for NULL FormIDs, i.e. records beside the main file header that
     # have a FormID of 0x00000000
@@ -536,18 +528,18 @@ def checkMods(progress, modInfos, showModList=False, showCRC=False,
     # masters that the containing plugin has
     hitmes = {}
     if all_hitmes:
-        for plugin_fn, found_hitmes in all_hitmes.items():
+        one_hitme_msg = _('1 HITME')
+        many_hitme_msg = _('%(num_hitmes)d HITMEs')
+        for plugin_fn, num_hitmes in all_hitmes.items():
             # HITMEs can't and shouldn't be fixed in vanilla files, so don't
             # show warnings for them
             plugin_is_vanilla = plugin_fn in vanilla_masters
-            if found_hitmes and not plugin_is_vanilla:
-                num_hitmes = len(found_hitmes)
+            if not plugin_is_vanilla:
                 # No point in making these translatable, HITME is a fixed term
                 if num_hitmes == 1:
-                    hitme_msg = _('1 HITME')
+                    hitme_msg = one_hitme_msg
                 else:
-                    hitme_msg = _('%(num_hitmes)d HITMEs') % {
-                        'num_hitmes': num_hitmes}
+                    hitme_msg = many_hitme_msg % {'num_hitmes': num_hitmes}
                 hitmes[plugin_fn] = hitme_msg
     # -------------------------------------------------------------------------
     # Some helpers for building the log
@@ -594,6 +586,10 @@ def format_record(raw_sig: bytes, fmt_fid: str, raw_eid=''):
             ret_fmt = f'{raw_eid} {ret_fmt}'
         return ret_fmt
     format_fid = pflags.format_fid
+    # These get used once per colliding record version, so translate them once
+    base_coll_msg = _('%(colliding_formid)s from %(colliding_plugin)s '
+                      '(base record)')
+    coll_msg = _('%(colliding_formid)s from %(colliding_plugin)s')
     def log_collision(coll_fid, coll_inj, coll_plugin, coll_versions):
         """Logs a single collision with the specified FormID, injected status,
         origin plugin and collision info."""
@@ -612,10 +608,9 @@ def log_collision(coll_fid, coll_inj, coll_plugin, coll_versions):
             fmt_record = format_record(ver_sig, proper_fid, ver_eid)
             # Mark the base record if the record wasn't injected
             if not coll_inj and ver_orig_plugin == coll_plugin:
-                msg = _('%(colliding_formid)s from %(colliding_plugin)s '
-                        '(base record)')
+                msg = base_coll_msg
             else:
-                msg = _('%(colliding_formid)s from %(colliding_plugin)s')
+                msg = coll_msg
             log('  * ' + msg % {'colliding_formid': fmt_record,
                                 'colliding_plugin': ver_orig_plugin})
     # -------------------------------------------------------------------------
@@ -644,8 +639,9 @@ def log_collision(coll_fid, coll_inj, coll_plugin, coll_versions):
     # already been merged into a BP
     if (merge := MergeabilityCheck.MERGE) in bush.game.mergeability_checks:
         minfos_cache, head, msg = merge.cached_types(modInfos)
+        merged_plugins = modInfos.merged
         can_merge = {m for inf in minfos_cache if (m := inf.fn_key) not in
-                     modInfos.merged and 'NoMerge' not in inf.getBashTags()}
+                     merged_plugins and 'NoMerge' not in all_plugin_tags[m]}
         if can_merge:
             _log_plugins(head, msg, can_merge)
     if should_deactivate:
@@ -872,51 +868,91 @@ def log_collision(coll_fid, coll_inj, coll_plugin, coll_versions):
     return log_header + u'\n\n' + log.out.getvalue()
 
 #------------------------------------------------------------------------------
+# We only need the near, far and clip values of XCLL subrecords to check fog
+# and only ever have to rewrite the near value (which sits at offset 12)
+_xcll_fog_unpacker = structs_cache['=12x2f8x4xf'].unpack_from
+_xcll_near_packer = structs_cache['=f'].pack_into
+
 class NvidiaFogFixer(object):
     """Fixes cells to avoid nvidia fog problem."""
     def __init__(self,modInfo):
         self.modInfo = modInfo
         self.fixedCells = set()
 
-    def fix_fog(self, progress, __unpacker=structs_cache[u'=12s2f2l2f'].unpack,
-                __packer=structs_cache[u'12s2f2l2f'].pack):
+    def fix_fog(self, progress,
+                __size_unpacker=structs_cache['=I'].unpack_from,
+                __walked_sigs=frozenset((b'GRUP', b'CELL')),
+                __cell_children_types=frozenset((6, 8, 9, 10))):
         """Duplicates file, then walks through and edits file as necessary."""
         progress.setFull(self.modInfo.fsize)
+        # Updating the progress bar for every single record is far too slow,
+        # so only do it in steps of 1%
+        prog_step = self.modInfo.fsize // 100
+        next_prog = 0
         fixedCells = self.fixedCells
         fixedCells.clear()
+        sh_unpacker = structs_cache[Subrecord.sub_header_fmt].unpack_from
+        sh_size = Subrecord.sub_header_size
         #--File stream
         #--Scan/Edit
         with TempFile() as out_path:
-            with ModReader.from_info(self.modInfo) as ins:
+            with ModReader.from_info(self.modInfo, in_memory=True) as ins:
                 with ShortFidWriteContext(out_path) as out:
-                    while not ins.atEnd():
-                        progress(ins.tell())
+                    # Store repeatedly used methods, accessing via dot is slow
+                    ins_at_end = ins.atEnd
+                    ins_read = ins.read
+                    ins_tell = ins.tell
+                    out_write = out.write
+                    while not ins_at_end():
+                        if (curr_pos := ins_tell()) >= next_prog:
+                            progress(curr_pos)
+                            next_prog = curr_pos + prog_step
                         header = unpack_header(ins)
                         _rsig = header.recType
                         # Copy the GRUP/record header
-                        out.write(header.pack_head())
+                        out_write(header.pack_head())
                         # Treat CELL block subgroups record by record - analyze
-                        # CELLs but just copy cell-children records over. If
-                        # _rsig == GRUP no need to do anything (copied above)
+                        # CELLs but just copy everything else over. The
+                        # children GRUPs of CELLs can't contain any CELLs, so
+                        # copy those over in one go as well. If we walk a GRUP
+                        # no need to do anything (copied above)
                         if ((header.is_top_group_header and
                              header.label != b'CELL') or
-                                _rsig != b'GRUP' and _rsig != b'CELL'):
-                            buff = ins.read(header.blob_size)
-                            out.write(buff)
+                                _rsig not in __walked_sigs or
+                                (_rsig == b'GRUP' and header.groupType in
+                                 __cell_children_types)):
+                            out_write(ins_read(header.blob_size))
                         #--Handle cells
                         elif _rsig == b'CELL':
-                            next_header = ins.tell() + header.blob_size
-                            while ins.tell() < next_header:
-                                subrec = SubrecordBlob(ins, _rsig)
-                                if subrec.mel_sig == b'XCLL':
-                                    color, near, far, rotXY, rotZ, fade, \
-                                        clip = __unpacker(subrec.mel_data)
+                            # Walk the subrecords in place and patch XCLL
+                            # directly in the buffer - no need to create a
+                            # SubrecordBlob for every single subrecord
+                            cell_data = bytearray(ins_read(header.blob_size))
+                            cell_size = len(cell_data)
+                            sub_pos = 0
+                            while sub_pos < cell_size:
+                                mel_sig, mel_size = sh_unpacker(cell_data,
+                                                                sub_pos)
+                                sub_pos += sh_size
+                                # Extended storage - very rare, so don't
+                                # optimize for it
+                                if mel_sig == b'XXXX':
+                                    real_size, = __size_unpacker(cell_data,
+                                                                 sub_pos)
+                                    sub_pos += mel_size
+                                    mel_sig, _ = sh_unpacker(cell_data,
+                                                             sub_pos)
+                                    sub_pos += sh_size
+                                    mel_size = real_size
+                                if mel_sig == b'XCLL':
+                                    near, far, clip = _xcll_fog_unpacker(
+                                        cell_data, sub_pos)
                                     if not (near or far or clip):
-                                        near = 0.0001
-                                        subrec.mel_data = __packer(color, near,
-                                            far, rotXY, rotZ, fade, clip)
+                                        _xcll_near_packer(cell_data,
+                                                          sub_pos + 12, 0.0001)
                                         fixedCells.add(header.fid)
-                                subrec.packSub(out, subrec.mel_data)
+                                sub_pos += mel_size
+                            out_write(cell_data)
             if fixedCells:
                 self.modInfo.makeBackup()
                 self.modInfo.abs_path.replace_with_temp(out_path)
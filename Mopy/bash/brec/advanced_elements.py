@@ -33,10 +33,11 @@
 from itertools import chain
 from typing import Any, BinaryIO
 
-from .basic_elements import MelBase, MelNull, MelNum, MelObject, \
-    MelSequential, MelStruct, MelGroups
+from .basic_elements import MelBase, MelFid, MelFloat, MelNull, MelNum, \
+    MelObject, MelSequential, MelStruct, MelGroups, merge_constant_defaults
+from .utils_constants import FID
 from .. import bush
-from ..bolt import attrgetter_cache, deprint, structs_cache, \
+from ..bolt import Rounder, attrgetter_cache, deprint, structs_cache, \
     flatten_multikey_dict
 from ..exception import ArgumentError, ModSizeError
 
@@ -178,6 +179,9 @@ def setDefault(self, record):
         record._loader_state = []
         record._seq_index = None
 
+    def constant_defaults(self):
+        return None
+
     def set_mel_set(self, mel_set):
         """Sets parent MelSet. We use this to collect the attribute names
         from each loader."""
@@ -329,6 +333,9 @@ def __init__(self, array_attr: str, element: MelBase,
         element_sig = next(iter(element.signatures))
         super(MelArray, self).__init__(element_sig, array_attr)
         self._element = element
+        # Plain structs can load all our entries at once, see _load_array
+        self._entry_struct = element if type(
+            element).load_mel is MelStruct.load_mel else None
         self._element_has_fids = False
         # Underscore means internal usage only - e.g. distributor state
         self.array_element_attrs = [s for s in element.getSlotsUsed() if
@@ -370,6 +377,9 @@ def setDefault(self, record):
             self._prelude.setDefault(record)
         setattr(record, self.attr, [])
 
+    def constant_defaults(self):
+        return None
+
     def mapFids(self, record, function, save_fids=False):
         if self._prelude_has_fids:
             self._prelude.mapFids(record, function, save_fids)
@@ -391,9 +401,15 @@ def load_mel(self, record, ins, sub_type, size_, *debug_strs):
         self._load_array(record, ins, sub_type, size_, *debug_strs)
 
     def _load_array(self, record, ins, sub_type, size_, *debug_strs):
-        append_entry = getattr(record, self.attr).append
         entry_slots = self.array_element_attrs
         entry_size = self._element_size
+        if entry_struct := self._entry_struct:
+            # A prelude may leave us with a negative size_ for broken data
+            if (entry_count := size_ // entry_size) > 0:
+                getattr(record, self.attr).extend(entry_struct.load_array(
+                    ins, entry_count, entry_slots, *debug_strs))
+            return
+        append_entry = getattr(record, self.attr).append
         load_entry = self._element.load_mel
         for x in range(size_ // entry_size):
             arr_entry = MelObject()
@@ -429,9 +445,31 @@ def __init__(self, array_attr, element: MelNum, prelude=None):
             raise SyntaxError(f'MelSimpleArray only accepts MelNum, passed: '
                               f'{element!r}')
         super().__init__(array_attr, element, prelude)
+        # Arrays of plain numbers, fids and floats can be unpacked in one go
+        # with a struct that repeats the element's format - store its format
+        # character and the conversion load_bytes would apply to each number
+        bulk_converters = {MelNum.load_bytes: None, MelFid.load_bytes: FID,
+                           MelFloat.load_bytes: Rounder}
+        element_load = type(element).load_bytes
+        if element_load in bulk_converters:
+            self._entry_fmt = element._unpacker.__self__.format[-1]
+            self._entry_converter = bulk_converters[element_load]
+        else:
+            self._entry_fmt = self._entry_converter = None
 
     def _load_array(self, record, ins, sub_type, size_, *debug_strs):
         entry_size = self._element_size
+        if entry_fmt := self._entry_fmt:
+            # A prelude may leave us with a negative size_ for broken data
+            if (entry_count := size_ // entry_size) <= 0:
+                return
+            entries = ins.unpack(
+                structs_cache[f'={entry_count}{entry_fmt}'].unpack,
+                entry_count * entry_size, *debug_strs)
+            if convert_entry := self._entry_converter:
+                entries = map(convert_entry, entries)
+            getattr(record, self.attr).extend(entries)
+            return
         load_element = self._element.load_bytes
         getattr(record, self.attr).extend([
             load_element(ins, entry_size, *debug_strs) for _x in
@@ -855,11 +893,13 @@ def _get_element_from_record(self, record):
 
     def getSlotsUsed(self):
         # We need to reserve every possible slot, since we can't know what
-        # we'll resolve to yet. Use a set to avoid duplicates.
-        slots_ret = {self.decider_result_attr}
+        # we'll resolve to yet. Use a dict to avoid duplicates while keeping
+        # the slot order stable.
+        slots_ret = dict.fromkeys([self.decider_result_attr])
         for element in self.element_mapping.values():
-            slots_ret.update(element.getSlotsUsed())
-        if self.fallback: slots_ret.update(self.fallback.getSlotsUsed())
+            slots_ret.update(dict.fromkeys(element.getSlotsUsed()))
+        if self.fallback:
+            slots_ret.update(dict.fromkeys(self.fallback.getSlotsUsed()))
         return tuple(slots_ret)
 
     def getLoaders(self, loaders):
@@ -899,6 +939,11 @@ def setDefault(self, record):
         for element in self.fid_elements:
             element.setDefault(record)
 
+    def constant_defaults(self):
+        # Same order as setDefault above
+        return merge_constant_defaults([*self.element_mapping.values(),
+            *([self.fallback] if self.fallback else ()), *self.fid_elements])
+
     def mapFids(self, record, function, save_fids=False):
         element = self._get_element_from_record(record)
         if element in self.fid_elements:
@@ -971,6 +1016,9 @@ def hasFids(self, formElements):
     def setDefault(self, record):
         self._wrapped_mel.setDefault(record)
 
+    def constant_defaults(self):
+        return self._wrapped_mel.constant_defaults()
+
     def load_mel(self, record, ins, sub_type, size_, *debug_strs):
         self._wrapped_mel.load_mel(record, ins, sub_type, size_, *debug_strs)
 
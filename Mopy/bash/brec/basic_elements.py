@@ -24,19 +24,46 @@
 higher-level building blocks can be found in common_subrecords.py."""
 from __future__ import annotations
 
+from copy import deepcopy
 from itertools import repeat
+from sys import intern
 from typing import BinaryIO
 
 from . import utils_constants
 from .utils_constants import FID, ZERO_FID, FixedString, get_structs, \
-    int_unpacker, null1
+    immutable_types, int_unpacker, null1
 from .. import bolt, bush, exception
 from ..bolt import Rounder, attrgetter_cache, decoder, encode, sig_to_str, \
     struct_calcsize, struct_error, structs_cache
 
+class _NullBytesCache(dict):
+    """Maps a width to a string of that many null bytes, so that MelStruct
+    defaults of the same width share a single bytes object."""
+    __slots__ = ()
+    def __missing__(self, key):
+        return self.setdefault(key, key * null1)
+
+_null_bytes = _NullBytesCache()
+
 #------------------------------------------------------------------------------
 class MelObject(object):
     """An empty class used by group and structure elements for data storage."""
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Subclasses with real slots need the generic deepcopy machinery
+        if '__slots__' in cls.__dict__:
+            cls.__deepcopy__ = None
+
+    def __deepcopy__(self, memo, __deepcopy=deepcopy,
+                     __immutable=immutable_types):
+        """Copy our __dict__ directly, skipping the much slower generic
+        __reduce_ex__ based deepcopy - records are copied a lot."""
+        cls = type(self)
+        memo[id(self)] = new_obj = cls.__new__(cls)
+        new_obj.__dict__.update({k: v if type(v) in __immutable else
+            __deepcopy(v, memo) for k, v in self.__dict__.items()})
+        return new_obj
+
     def __eq__(self,other):
         """Operator: =="""
         return isinstance(other,MelObject) and self.__dict__ == other.__dict__
@@ -50,31 +77,69 @@ def __hash__(self):
 
     def __repr__(self):
         """Carefully try to show as much info about ourselves as possible."""
-        cond_val_data = bush.game.condition_function_data
         to_show = []
-        if hasattr(self, u'__slots__'):
-            for obj_attr in self.__slots__:
-                # attrs starting with _ are internal - union types,
-                # distributor states, etc.
-                if not obj_attr.startswith(u'_') and hasattr(self, obj_attr):
-                    obj_val = getattr(self, obj_attr)
-                    # Show the CK names for condition functions, their numeric
-                    # representation is really hard to work with
-                    if obj_attr == u'ifunc':
-                        to_show.append(u'%s: %d (%s)' % (
-                            obj_attr, obj_val,
-                            cond_val_data.get(obj_val, [u'Unknown'])[0]))
-                    else:
-                        to_show.append(u'%s: %r' % (obj_attr, obj_val))
-        return u'<%s>' % u', '.join(sorted(to_show)) # is sorted() needed here?
+        # Show attributes in slot order - MelSequential etc. collect slots in
+        # a stable order that follows the record definition
+        for obj_attr in getattr(self, '__slots__', ()):
+            # attrs starting with _ are internal - union types,
+            # distributor states, etc.
+            if obj_attr.startswith('_'):
+                continue
+            try:
+                obj_val = getattr(self, obj_attr)
+            except AttributeError:
+                continue
+            # Show the CK names for condition functions, their numeric
+            # representation is really hard to work with
+            if obj_attr == 'ifunc':
+                cond_val_data = bush.game.condition_function_data
+                to_show.append('%s: %d (%s)' % (obj_attr, obj_val,
+                    cond_val_data.get(obj_val, ['Unknown'])[0]))
+            else:
+                to_show.append(f'{obj_attr}: {obj_val!r}')
+        return f'<{", ".join(to_show)}>'
+
+def merge_constant_defaults(elements) -> dict | None:
+    """Merge the constant defaults of the specified elements, in the order in
+    which their setDefault methods would be called. Return None if any of
+    them has dynamic defaults - see MelBase.constant_defaults."""
+    merged_defaults = {}
+    for element in elements:
+        if (elem_defaults := element.constant_defaults()) is None:
+            return None
+        merged_defaults.update(elem_defaults)
+    return merged_defaults
+
+def split_defaults(elements) -> tuple[dict, tuple]:
+    """Split elements into the ones that always set the very same default
+    values and the ones that must create fresh defaults (e.g. lists or flags)
+    every time - see MelBase.constant_defaults. Return a dict of the constant
+    defaults and a tuple of the dynamic elements - the constant defaults must
+    be applied first, then setDefault must be called on the dynamic
+    elements."""
+    const_defaults = {}
+    dynamic_elements = []
+    dynamic_attrs = set()
+    for element in elements:
+        elem_defaults = element.constant_defaults()
+        # Constant defaults get set first, so they must not override the
+        # defaults of an earlier dynamic element
+        if elem_defaults is not None and dynamic_attrs.isdisjoint(
+                elem_defaults):
+            const_defaults.update(elem_defaults)
+        else:
+            dynamic_elements.append(element)
+            dynamic_attrs.update(element.getSlotsUsed())
+    return const_defaults, tuple(dynamic_elements)
 
 class Subrecord(object):
     """A subrecord. Base class defines the subrecord format and packing."""
     # TODO(ut): WIP! mel_sig does not make sense for all subclasses
     # Format used by sub-record headers. Morrowind uses a different one.
     sub_header_fmt = u'=4sH'
-    # precompiled unpacker for sub-record headers
+    # precompiled unpacker and packer for sub-record headers
     sub_header_unpack = structs_cache[sub_header_fmt].unpack
+    sub_header_pack = structs_cache[sub_header_fmt].pack
     # Size of sub-record headers. Morrowind has a different one.
     sub_header_size = 6
     __slots__ = (u'mel_sig',)
@@ -94,10 +159,11 @@ def _dump_bytes(self, out, binary_data, lenData):
         with size > 0xFFFF."""
         outWrite = out.write
         if lenData > 0xFFFF:
-            MelXXXX(lenData).dumpData(u'record', out)
+            # Write the XXXX subrecord directly, no need for a MelXXXX here
+            outWrite(Subrecord.sub_header_pack(b'XXXX', 4))
+            bolt.pack_int(out, lenData)
             lenData = 0
-        outWrite(structs_cache[Subrecord.sub_header_fmt].pack(self.mel_sig,
-                                                              lenData))
+        outWrite(Subrecord.sub_header_pack(self.mel_sig, lenData))
         outWrite(binary_data)
 
 def unpackSubHeader(ins, rsig, *, file_offset=0, __unpacker=int_unpacker,
@@ -130,12 +196,18 @@ class SubrecordBlob(Subrecord):
     current usages."""
     __slots__ = (u'mel_data',)
 
-    def __init__(self, ins, record_sig, mel_sigs=frozenset()):
-        # record_sig is the sig of parent record
+    def __init__(self, ins, record_sig, mel_sigs=frozenset(), rec_data=None):
+        # record_sig is the sig of parent record - if rec_data (the bytes ins
+        # is reading) is passed, mel_data is sliced directly out of it
         mel_sig, mel_size = unpackSubHeader(ins, record_sig)
         self.mel_sig = mel_sig
         if not mel_sigs or mel_sig in mel_sigs:
-            self.mel_data = ins.read(mel_size, record_sig, self.mel_sig)
+            if rec_data is None:
+                self.mel_data = ins.read(mel_size, record_sig, mel_sig)
+            else:
+                data_start = ins.tell()
+                ins.seek(mel_size, 1, record_sig, mel_sig)
+                self.mel_data = rec_data[data_start:data_start + mel_size]
         else:
             self.mel_data = None
             ins.seek(mel_size, 1) # discard the data
@@ -163,7 +235,10 @@ class MelBase(Subrecord):
     def __init__(self, mel_sig: bytes, attr: str, *, set_default=None):
         """Passing a value for set_default will result in the MelBase
         instance dumping record.attr even if not loaded. Use sparingly!"""
-        self.mel_sig, self.attr, self.set_default = mel_sig, attr, set_default
+        # Intern attr, it may have been built dynamically (e.g. via f-strings)
+        # and getattr/setattr would otherwise intern it on every call
+        self.mel_sig, self.attr, self.set_default = mel_sig, intern(attr), \
+            set_default
 
     def getSlotsUsed(self):
         return self.attr,
@@ -185,9 +260,18 @@ def hasFids(self,formElements):
         pass
 
     def setDefault(self,record):
-        """Sets default value for record instance."""
+        """Sets default value for record instance. If you override this, you
+        must override constant_defaults as well."""
         setattr(record, self.attr, self.set_default)
 
+    def constant_defaults(self) -> dict | None:
+        """Return a dict mapping the attributes setDefault sets to their
+        values if setDefault sets the very same objects on every call, so
+        that they may be set on new records in one go. Return None if
+        setDefault has to create new objects every time (e.g. lists or
+        flags)."""
+        return {self.attr: self.set_default}
+
     def load_mel(self, record, ins, sub_type, size_, *debug_strs):
         """Read the actual data (not the headers) from ins into record
         attribute."""
@@ -263,6 +347,23 @@ class MelNum(MelBase):
     def __init__(self, mel_sig, attr='_unused', *, set_default=None):
         super().__init__(mel_sig, attr, set_default=set_default)
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Our load_mel skips load_bytes, so subclasses that deserialize the
+        # number further (flags, fids, etc.) must go through it again - unless
+        # the load_mel they inherit is at least as specialized as their
+        # load_bytes (e.g. MelFloat subclasses)
+        def _owner_index(meth_name):
+            return next(i for i, c in enumerate(cls.__mro__)
+                        if meth_name in c.__dict__)
+        if _owner_index('load_bytes') < _owner_index('load_mel'):
+            cls.load_mel = MelBase.load_mel
+
+    def load_mel(self, record, ins, sub_type, size_, *debug_strs):
+        # Inlined load_bytes - this runs for every numeric subrecord we load
+        setattr(record, self.attr,
+                ins.unpack(self._unpacker, size_, *debug_strs)[0])
+
     def load_bytes(self, ins, size_, *debug_strs):
         return ins.unpack(self._unpacker, size_, *debug_strs)[0]
 
@@ -285,6 +386,9 @@ def getSlotsUsed(self):
     def setDefault(self,record):
         pass
 
+    def constant_defaults(self):
+        return {}
+
     def load_mel(self, record, ins, sub_type, size_, *debug_strs):
         ins.seek(size_, 1, *debug_strs)
 
@@ -304,6 +408,9 @@ def __init__(self, *elements):
         self._possible_sigs = {s for element in self.elements for s
                                in element.signatures}
         self._sub_loaders = {}
+        # Bind the elements' dumpData methods once - dumpData runs for every
+        # record we write and the elements are of many different types
+        self._element_dumpers = tuple([e.dumpData for e in self.elements])
 
     def getDefaulters(self, defaulters, base):
         for element in self.elements:
@@ -316,10 +423,9 @@ def getLoaders(self, loaders):
         loaders.update(self._sub_loaders)
 
     def getSlotsUsed(self):
-        slots_ret = set()
-        for element in self.elements:
-            slots_ret.update(element.getSlotsUsed())
-        return tuple(slots_ret)
+        # Use a dict to discard duplicates while keeping the slot order stable
+        return tuple(dict.fromkeys([s for element in self.elements
+                                    for s in element.getSlotsUsed()]))
 
     def hasFids(self, formElements):
         for element in self.elements:
@@ -330,6 +436,9 @@ def setDefault(self, record):
         for element in self.elements:
             element.setDefault(record)
 
+    def constant_defaults(self):
+        return merge_constant_defaults(self.elements)
+
     def load_mel(self, record, ins, sub_type, size_, *debug_strs):
         # This will only ever be called if we're used in a distributor, regular
         # MelSet will just bypass us entirely. So just redirect to the right
@@ -338,8 +447,8 @@ def load_mel(self, record, ins, sub_type, size_, *debug_strs):
                                              *debug_strs)
 
     def dumpData(self, record, out):
-        for element in self.elements:
-            element.dumpData(record, out)
+        for element_dumper in self._element_dumpers:
+            element_dumper(record, out)
 
     def mapFids(self, record, function, save_fids=False):
         for element in self.form_elements:
@@ -359,8 +468,10 @@ def sort_subrecord(self, record):
     def signatures(self):
         return self._possible_sigs
 
-    @property
+    @bolt.fast_cached_property
     def static_size(self):
+        # Our elements never change, so only sum up their sizes once (if
+        # they can't tell, this raises and is simply not cached)
         return sum([element.static_size for element in self.elements])
 
 #------------------------------------------------------------------------------
@@ -374,7 +485,7 @@ class MelGroup(MelSequential):
     """Represents a group record."""
     def __init__(self, attr: str, *elements):
         super(MelGroup, self).__init__(*elements)
-        self.attr, self.loaders = attr, {}
+        self.attr, self.loaders = intern(attr), {} # see MelBase.__init__
 
     def getDefaulters(self,defaulters,base):
         defaulters[base+self.attr] = self
@@ -391,11 +502,30 @@ def getSlotsUsed(self):
     def setDefault(self,record):
         setattr(record, self.attr, None)
 
+    def constant_defaults(self):
+        return {self.attr: None}
+
+    @bolt.fast_cached_property
+    def _group_slots(self):
+        """The slots of the MelObjects we create - computed once, since
+        getDefault runs for every group instance we load."""
+        return tuple([s for element in self.elements for s in
+                      element.getSlotsUsed()])
+
+    @bolt.fast_cached_property
+    def _group_defaults(self):
+        """The constant defaults, which we can copy into new MelObjects with
+        a single dict update, and the dynamic elements - see
+        split_defaults."""
+        const_defaults, dynamic_elements = split_defaults(self.elements)
+        return {'__slots__': self._group_slots, **const_defaults}, \
+            dynamic_elements
+
     def getDefault(self):
         target = MelObject()
-        target.__slots__ = [s for element in self.elements for s in
-                            element.getSlotsUsed()]
-        for element in self.elements:
+        const_defaults, dynamic_elements = self._group_defaults
+        target.__dict__.update(const_defaults)
+        for element in dynamic_elements:
             element.setDefault(target)
         return target
 
@@ -433,6 +563,9 @@ def __init__(self, attr: str, *elements):
     def setDefault(self,record):
         setattr(record, self.attr, [])
 
+    def constant_defaults(self):
+        return None
+
     def load_mel(self, record, ins, sub_type, size_, *debug_strs):
         if sub_type in self._init_sigs:
             # We've hit one of the initial signatures, make a new object
@@ -450,10 +583,10 @@ def _new_object(self, record):
         return target
 
     def dumpData(self,record,out):
-        elements = self.elements
+        element_dumpers = self._element_dumpers
         for target in getattr(record, self.attr):
-            for element in elements:
-                element.dumpData(target,out)
+            for element_dumper in element_dumpers:
+                element_dumper(target, out)
 
     def mapFids(self, record, function, save_fids=False):
         formElements = self.form_elements
@@ -550,9 +683,19 @@ def mapFids(self, record, function, save_fids=False):
                 setattr(record, self.attr, mapped)
 
     def dumpData(self, record, out):
-        pack_el = self._element.packer
-        for target in getattr(record, self.attr):
-            self.packSub(out, pack_el(target))
+        if not (group_vals := getattr(record, self.attr)): return
+        # All our subrecords have the same (static) size and therefore the
+        # same header, so pack everything in one go rather than calling
+        # packSub for each entry
+        try:
+            sub_header = Subrecord.sub_header_pack(self.mel_sig,
+                                                   self._element.static_size)
+            out.write(sub_header + sub_header.join(
+                map(self._element.packer, group_vals)))
+        except Exception:
+            bolt.deprint(f'{self!r}: Failed packing: '
+                         f'{self.mel_sig!r}, {group_vals!r}')
+            raise
 
 #------------------------------------------------------------------------------
 class MelString(MelBase):
@@ -612,6 +755,9 @@ class MelStrings(MelString):
     def setDefault(self,record):
         setattr(record, self.attr, [])
 
+    def constant_defaults(self):
+        return None
+
     def getDefault(self):
         return []
 
@@ -675,6 +821,19 @@ def __init__(self, mel_sig: bytes, struct_formats: list[str], *elements,
             present_attrs.add(a)
         self._unpacker, self._packer, self._static_size, = get_structs(
             struct_format)
+        self._iter_unpack = structs_cache[struct_format].iter_unpack
+        # Precompute what load_mel and pack_subrecord_data need per call - a
+        # single attrgetter for all attrs only returns a tuple for 2+ attrs
+        self._has_actions = bool(self._action_dexes)
+        self._plain_attrs = tuple([(i, a) for i, (a, act) in enumerate(zip(
+            self.attrs, self.actions)) if act is None])
+        self._action_attrs = tuple([(i, self.attrs[i], self.actions[i])
+                                    for i in sorted(self._action_dexes)])
+        self._attrs_getter = attrgetter_cache[self.attrs] if len(
+            self.attrs) > 1 else self._get_attrs
+
+    def _get_attrs(self, record):
+        return tuple([getattr(record, a) for a in self.attrs])
 
     def getSlotsUsed(self):
         return self.attrs
@@ -687,23 +846,54 @@ def setDefault(self, record, *, __nones=repeat(None)):
         for att, value in zip(self.attrs, vals):
             setattr(record, att, value)
 
+    def constant_defaults(self):
+        if not self._is_required:
+            return dict.fromkeys(self.attrs)
+        return dict(zip(self.attrs, self.defaults))
+
     def load_mel(self, record, ins, sub_type, size_, *debug_strs):
         unpacked = ins.unpack(self._unpacker, size_, *debug_strs)
-        for att, val, action in zip(self.attrs, unpacked, self.actions):
-            setattr(record, att, action(val) if action is not None else val)
+        if self._has_actions:
+            for dex, att in self._plain_attrs:
+                setattr(record, att, unpacked[dex])
+            for dex, att, action in self._action_attrs:
+                setattr(record, att, action(unpacked[dex]))
+        else:
+            for att, val in zip(self.attrs, unpacked):
+                setattr(record, att, val)
+
+    def load_array(self, ins, entry_count, entry_slots, *debug_strs):
+        """Load entry_count consecutive instances of this struct into a list
+        of new MelObjects, unpacking them all in one go - see MelArray."""
+        entries = []
+        append_entry = entries.append
+        attrs = self.attrs
+        action_attrs = self._action_attrs
+        for unpacked in self._iter_unpack(ins.read(
+                entry_count * self._static_size, *debug_strs)):
+            arr_entry = MelObject()
+            entry_dict = arr_entry.__dict__
+            entry_dict['__slots__'] = entry_slots
+            entry_dict.update(zip(attrs, unpacked))
+            for dex, att, action in action_attrs:
+                entry_dict[att] = action(unpacked[dex])
+            append_entry(arr_entry)
+        return entries
 
-    def pack_subrecord_data(self, record, *, __attrgetters=attrgetter_cache):
-        values = [__attrgetters[a](record) for a in self.attrs]
-        for dex in self._action_dexes:
-            try:
-                values[dex] = values[dex].dump()
-            except AttributeError:
-                if values[dex] is None: # assume all the rest are None
-                    return None # don't dump this one, was not loaded
-                # Apply the action to itself before dumping to handle
-                # e.g. a FixedString getting assigned a unicode value.
-                # Needed also when we read a flag say from a csv
-                values[dex] = self.actions[dex](values[dex]).dump()
+    def pack_subrecord_data(self, record):
+        values = self._attrs_getter(record)
+        if self._has_actions: # else pack the attrs tuple as is, no copying
+            values = list(values)
+            for dex in self._action_dexes:
+                try:
+                    values[dex] = values[dex].dump()
+                except AttributeError:
+                    if values[dex] is None: # assume all the rest are None
+                        return None # don't dump this one, was not loaded
+                    # Apply the action to itself before dumping to handle
+                    # e.g. a FixedString getting assigned a unicode value.
+                    # Needed also when we read a flag say from a csv
+                    values[dex] = self.actions[dex](values[dex]).dump()
         try:
             return self._packer(*values)
         except struct_error:
@@ -720,7 +910,8 @@ def mapFids(self, record, function, save_fids=False):
     def static_size(self):
         return self._static_size
 
-    def _parseElements(self, struct_formats, *elements, __zero_fid=ZERO_FID):
+    def _parseElements(self, struct_formats, *elements, __zero_fid=ZERO_FID,
+                       __null_bytes=_null_bytes):
         formAttrs = set()
         lenEls = len(elements)
         attrs, deflts, actions = [0] * lenEls, [0] * lenEls, [None] * lenEls
@@ -730,7 +921,7 @@ def _parseElements(self, struct_formats, *elements, __zero_fid=ZERO_FID):
             if not isinstance(element,tuple):
                 attrs[index] = element
                 if type(fmt_str) is int and fmt_str: # 0 for weird subclasses
-                    deflts[index] = fmt_str * null1
+                    deflts[index] = __null_bytes[fmt_str]
                 elif fmt_str == u'f':
                     actions[index] = Rounder
                     self._action_dexes.add(index)
@@ -752,11 +943,13 @@ def _parseElements(self, struct_formats, *elements, __zero_fid=ZERO_FID):
                 if len(element) - attrIndex == 2:
                     deflts[index] = element[-1] # else leave to 0
                 elif type(fmt_str) is int and fmt_str: # 0 for weird subclasses
-                    deflts[index] = fmt_str * null1
+                    deflts[index] = __null_bytes[fmt_str]
         for dex in self._action_dexes: # apply the actions to defaults once
             act = actions[dex]
             deflts[dex] = __zero_fid if act is FID else act(deflts[dex])
-        return tuple(attrs), tuple(deflts), tuple(actions), formAttrs
+        # Intern the attrs, see MelBase.__init__
+        return tuple(map(intern, attrs)), tuple(deflts), tuple(actions), \
+            formAttrs
 
     @staticmethod
     def _expand_formats(elements, struct_formats):
@@ -780,14 +973,35 @@ class MelFixedString(MelStruct):
     def __init__(self, mel_sig, attr, str_length, *, set_default=None):
         el = (FixedString(str_length, set_default or ''), attr)
         super().__init__(mel_sig, [f'{str_length:d}s'], el)
+        self._str_attr = attr
+
+    # We only have one attribute and its action, skip MelStruct's loops
+    def load_mel(self, record, ins, sub_type, size_, *debug_strs):
+        setattr(record, self._str_attr, self.actions[0](
+            ins.unpack(self._unpacker, size_, *debug_strs)[0]))
+
+    def pack_subrecord_data(self, record):
+        fixed_str = getattr(record, self._str_attr)
+        try:
+            return self._packer(fixed_str.dump())
+        except AttributeError:
+            if fixed_str is None:
+                return None # don't dump this one, was not loaded
+            # Handle e.g. a unicode value getting assigned, see MelStruct
+            return self._packer(self.actions[0](fixed_str).dump())
 
 # Simple primitive type wrappers ----------------------------------------------
 class MelFloat(MelNum):
     """Float."""
     _unpacker, packer, static_size = get_structs(u'=f')
 
+    def load_mel(self, record, ins, sub_type, size_, *debug_strs):
+        # Inlined load_bytes, see MelNum.load_mel
+        setattr(record, self.attr,
+                Rounder(ins.unpack(self._unpacker, size_, *debug_strs)[0]))
+
     def load_bytes(self, ins, size_, *debug_strs): ##: note we dont round on dump
-        return Rounder(super().load_bytes(ins, size_, *debug_strs))
+        return Rounder(ins.unpack(self._unpacker, size_, *debug_strs)[0])
 
 class MelSInt8(MelNum):
     """Signed 8-bit integer."""
@@ -822,7 +1036,9 @@ class MelUInt32(MelNum):
     _unpacker, packer, static_size = get_structs(u'=I')
 
 class _MelFlags(MelNum):
-    """Integer flag field."""
+    """Integer flag field. Note that it has to come after the MelNum class
+    defining the format, so that Flags instances get packed by that struct
+    directly (via Flags.__index__)."""
     __slots__ = (u'_flag_type', u'_flag_default')
 
     def __init__(self, mel_sig, attr, flags_type, *, set_default=None):
@@ -833,13 +1049,13 @@ def __init__(self, mel_sig, attr, flags_type, *, set_default=None):
     def setDefault(self, record):
         setattr(record, self.attr, self._flag_type(self.set_default or 0))
 
+    def constant_defaults(self):
+        return None
+
     def load_bytes(self, ins, size_, *debug_strs):
         return self._flag_type(
             ins.unpack(self._unpacker, size_, *debug_strs)[0])
 
-    def packer(self, flag_val): # override class variable, access parent's
-        return super(_MelFlags, self.__class__).packer(flag_val.dump())
-
 class MelUInt8Flags(MelUInt8, _MelFlags): pass
 class MelUInt16Flags(MelUInt16, _MelFlags): pass
 class MelUInt32Flags(MelUInt32, _MelFlags): pass
@@ -872,7 +1088,7 @@ def __init__(self, int_size):
         self.mel_sig = b'XXXX'
 
     def load_mel(self, record, ins, sub_type, size_, *debug_strs):
-        self.int_size = self.load_bytes(ins, size_, *debug_strs)
+        self.int_size = ins.unpack(self._unpacker, size_, *debug_strs)[0]
 
     def pack_subrecord_data(self, record):
         return self.packer(self.int_size)
@@ -201,6 +201,9 @@ class MelMasterNames(MelBase):
         def __init__(self, has_sizes=True):
             self._has_sizes = has_sizes
             self.mel_sig = b'MAST' # just in case something is expecting this
+            # Used to dump the masters - create them once, not per master
+            self._mast_element = MelUnicode(b'MAST', '', encoding='cp1252')
+            self._data_element = MelBase(b'DATA', '')
 
         def getLoaders(self, loaders):
             loaders[b'MAST'] = self
@@ -216,6 +219,9 @@ def setDefault(self, record):
             if self._has_sizes:
                 record.master_sizes = []
 
+        def constant_defaults(self):
+            return None
+
         def load_mel(self, record, ins, sub_type, size_, *debug_strs):
             __unpacker=structs_cache[u'Q'].unpack
             if sub_type == b'MAST':
@@ -234,17 +240,16 @@ def load_mel(self, record, ins, sub_type, size_, *debug_strs):
 
         def dumpData(self,record,out):
             record._truncate_master_sizes()
+            mast_element = self._mast_element
             if self._has_sizes:
+                data_element = self._data_element
                 for master_name, master_size in zip(record.masters,
                                                     record.master_sizes):
-                    MelUnicode(b'MAST', '', encoding=u'cp1252').packSub(
-                        out, master_name)
-                    MelBase(b'DATA', '').packSub(
-                        out, struct_pack(u'Q', master_size))
+                    mast_element.packSub(out, master_name)
+                    data_element.packSub(out, struct_pack(u'Q', master_size))
             else:
                 for master_name in record.masters:
-                    MelUnicode(b'MAST', '', encoding=u'cp1252').packSub(
-                        out, master_name)
+                    mast_element.packSub(out, master_name)
 
     class MelAuthor(MelUnicode):
         def __init__(self):
@@ -31,13 +31,12 @@
     MelGroups, MelLString, MelNull, MelReadOnly, MelSequential, \
     MelSInt32, MelString, MelStrings, MelStruct, MelUInt8, MelUInt8Flags, \
     MelUInt16Flags, MelUInt32, MelUInt32Flags, MelSInt8, MelUInt16, \
-    MelSimpleGroups, MelUInt32Bool
+    MelSimpleGroups, MelUInt32Bool, merge_constant_defaults
 from .utils_constants import FID, ZERO_FID, ambient_lighting_attrs, \
     color_attrs, color3_attrs, int_unpacker, null1, gen_coed_key, \
     PackGeneralFlags, PackInterruptFlags, position_attrs, rotation_attrs, \
     EnableParentFlags
-from ..bolt import Flags, TrimmedFlags, dict_sort, encode, flag, struct_pack, \
-    structs_cache
+from ..bolt import Flags, TrimmedFlags, dict_sort, encode, flag, structs_cache
 from ..exception import ModError
 
 #------------------------------------------------------------------------------
@@ -1304,6 +1303,9 @@ def hasFids(self,formElements):
     def setDefault(self,record):
         setattr(record, self.attr, None)
 
+    def constant_defaults(self):
+        return {self.attr: None}
+
     def load_mel(self, record, ins, sub_type, size_, *debug_strs,
                  __unpacker=int_unpacker, __load_fid=_fid_element.load_bytes):
         insUnpack = ins.unpack
@@ -1735,6 +1737,9 @@ def __init__(self, indx_to_attr: dict[int, str], group_loaders):
         self._possible_sigs = {s for element
                                in self._indx_to_loader.values()
                                for s in element.signatures}
+        # Create the INDX element and sort the parts once, not on every dump
+        self._indx_element = MelUInt32(b'INDX', 'UNUSED')
+        self._sorted_indx_attrs = tuple(dict_sort(indx_to_attr))
 
     def getLoaders(self, loaders):
         temp_loaders = {}
@@ -1750,6 +1755,9 @@ def setDefault(self, record):
         for element in self._indx_to_loader.values():
             element.setDefault(record)
 
+    def constant_defaults(self):
+        return merge_constant_defaults(self._indx_to_loader.values())
+
     def load_mel(self, record, ins, sub_type, size_, *debug_strs,
                  __unpacker=int_unpacker):
         if sub_type == b'INDX':
@@ -1760,10 +1768,10 @@ def load_mel(self, record, ins, sub_type, size_, *debug_strs,
 
     def dumpData(self, record, out):
         # Note that we have to dump out the attributes sorted by the INDX value
-        for part_indx, part_attr in dict_sort(self._indx_to_attr):
+        indx_element = self._indx_element
+        for part_indx, part_attr in self._sorted_indx_attrs:
             if hasattr(record, part_attr): # only dump present parts
-                MelUInt32(b'INDX', 'UNUSED').packSub(out,
-                    struct_pack('=I', part_indx))
+                indx_element.packSub(out, indx_element.packer(part_indx))
                 self._indx_to_loader[part_indx].dumpData(record, out)
 
     @property
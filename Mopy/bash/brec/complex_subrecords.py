@@ -191,13 +191,20 @@ def __init__(self, ctda_sub_sig=b'CTDA',
         if suffix_fmt is None: suffix_fmt = []
         if suffix_elements is None: suffix_elements = []
         if old_suffix_fmts is None: old_suffix_fmts = set()
-        super().__init__({
-            # Build a (potentially truncated) struct for each function index
-            func_index: self._build_struct(func_data, ctda_sub_sig, suffix_fmt,
-                                           suffix_elements, old_suffix_fmts)
-            for func_index, func_data
-            in bush.game.condition_function_data.items()
-        }, decider=PartialLoadDecider(
+        # Build a (potentially truncated) struct for each function index. The
+        # structs only depend on the parameter types, which most functions
+        # share, so build one per parameter types - saves creating thousands
+        # of identical structs when loading the game's record definitions
+        param_structs = {}
+        func_structs = {}
+        for func_index, func_data in bush.game.condition_function_data.items():
+            try:
+                func_structs[func_index] = param_structs[func_data[1:]]
+            except KeyError:
+                func_structs[func_index] = param_structs[func_data[1:]] = \
+                    self._build_struct(func_data, ctda_sub_sig, suffix_fmt,
+                                       suffix_elements, old_suffix_fmts)
+        super().__init__(func_structs, decider=PartialLoadDecider(
             # Skip everything up to the function index in one go, we'll be
             # discarding this once we rewind anyways.
             loader=MelStruct(ctda_sub_sig, ['8s', 'H'], 'ctda_skip', 'ifunc'),
@@ -299,6 +306,9 @@ def getSlotsUsed(self):
     def setDefault(self, record):
         next(iter(self.element_mapping.values())).setDefault(record)
 
+    def constant_defaults(self):
+        return next(iter(self.element_mapping.values())).constant_defaults()
+
 class _MelCtdaFo3(_MelCtda):
     """Version of _MelCtda that handles the additional complexities that were
     introduced in FO3 (and present in all games after that):
@@ -614,8 +624,7 @@ def efix_param_info(self, new_efix_info):
             target = _MelHackyObject()
             for element in self.elements:
                 element.setDefault(target)
-            target.__slots__ = [s for element in self.elements for s in
-                                element.getSlotsUsed()]
+            target.__slots__ = self._group_slots
             setattr(record, self.attr, target)
         self.loaders[sub_type].load_mel(target, ins, sub_type, size_,
             *debug_strs)
@@ -1418,7 +1427,9 @@ def packSub(self, out: BinaryIO, stag_sr_data: tuple[int, str]):
 # Helpers ---------------------------------------------------------------------
 _vmad_key_fragments = attrgetter_cache['fragment_index']
 _vmad_key_properties = attrgetter_cache['prop_name']
-_vmad_key_qust_aliases = attrgetter_cache['alias_ref_obj']
+# Object refs sort by FormID only (see _ObjectRef.__lt__) - key on that
+# directly so sorting doesn't go through _ObjectRef's comparison for each pair
+_vmad_key_qust_aliases = attrgetter_cache['alias_ref_obj._fid']
 _vmad_key_qust_fragments = attrgetter_cache[('quest_stage',
                                             'quest_stage_index')]
 _vmad_key_script = attrgetter_cache['script_name']
@@ -1512,7 +1523,8 @@ class _MelComponentInstance(MelObject):
 
     def make_new(self):
         """Creates a new runtime instance of this component with the
-        appropriate __slots__ set."""
+        appropriate __slots__ set. Loops creating many components bind
+        _component_class directly instead, to skip this call."""
         return self._component_class()
 
     # Note that there is no has_fids - components (e.g. properties) with fids
@@ -1555,7 +1567,7 @@ def load_frag(self, record, ins, vmad_ctx: AVmadContext, *debug_strs):
         # Finally, inspect the flags and load the appropriate children. We must
         # always load and dump these in the exact order specified by the
         # subclass!
-        new_child = self._child_loader.make_new
+        new_child = self._child_loader._component_class
         load_child = self._child_loader.load_frag
         for flag_attr, child_attr in self._flags_to_children.items():
             cont_child = None
@@ -1607,7 +1619,7 @@ def load_frag(self, record, ins, vmad_ctx: AVmadContext, *debug_strs):
         super().load_frag(record, ins, vmad_ctx, *debug_strs)
         # Then, load each child
         children = []
-        new_child = self._child_loader.make_new
+        new_child = self._child_loader._component_class
         load_child = self._child_loader.load_frag
         append_child = children.append
         for _x in range(getattr(record, self._counter_attr)):
@@ -1897,7 +1909,7 @@ def load_frag(self, record, ins, vmad_ctx: AVmadContext, *debug_strs):
         self._script_loader.load_frag(frag_sc, ins, vmad_ctx, *debug_strs)
         # Then, load each alias
         record.qust_aliases = []
-        new_alias = self._alias_loader.make_new
+        new_alias = self._alias_loader._component_class
         load_alias = self._alias_loader.load_frag
         append_alias = record.qust_aliases.append
         for _x in range(unpack_short(ins)):
@@ -1961,7 +1973,7 @@ def load_frag(self, record, ins, vmad_ctx: AVmadContext, *debug_strs):
         super().load_frag(record, ins, vmad_ctx, *debug_strs)
         # Then, load each phase fragment
         record.phase_fragments = []
-        new_fragment = self._phase_loader.make_new
+        new_fragment = self._phase_loader._component_class
         load_fragment = self._phase_loader.load_frag
         append_fragment = record.phase_fragments.append
         for _x in range(unpack_short(ins)):
@@ -2132,7 +2144,7 @@ def load_frag(self, record, ins, vmad_ctx: AVmadContext, *debug_strs):
                 ins.read(array_len, *debug_strs))]
         else: # val_ty == 17 - struct array
             record.val_data = struct_list = []
-            new_struct = self._struct_loader.make_new
+            new_struct = self._struct_loader._component_class
             load_struct = self._struct_loader.load_frag
             append_struct = struct_list.append
             array_len = unpack_int(ins)
@@ -2406,7 +2418,7 @@ class _MelVmadImpl(MelObject):
         vmad_ctx = self._vmad_context_class(vmad_ver, obj_format)
         # Next, load any scripts that may be present
         vmad.scripts = []
-        new_script = self._script_loader.make_new
+        new_script = self._script_loader._component_class
         load_script = self._script_loader.load_frag
         append_script = vmad.scripts.append
         for i in range(unpack_short(ins)):
@@ -35,6 +35,15 @@
 from ..exception import ModError, ModReadError, ModSizeError, StateError
 from ..game import ObjectIndexRange
 
+# Buffer size used when opening plugins - reading plugins involves many small
+# reads and seeks, so use a large buffer to cut down on syscalls
+_PLUGIN_BUFFER_SIZE = 1 << 20 # 1 MiB
+# Upper bound for the initial output buffer when decompressing record data.
+# The expected size comes from the record itself and may be garbage in a
+# corrupt plugin, so don't let it make zlib preallocate more than 64 MiB -
+# zlib will still grow the buffer if the real data turns out to be larger
+MAX_DECOMPRESS_BUFSIZE = 0x4000000 # 64 MiB
+
 #------------------------------------------------------------------------------
 # Headers ---------------------------------------------------------------------
 ##: Ideally this would sit in record_structs, but circular imports...
@@ -78,6 +87,8 @@ def form_version(self):
 class RecHeader(RecordHeader):
     """Fixed size structure defining next record."""
     __slots__ = ('blob_size', 'fid', 'flags1', 'flags2')
+    # The raw 'compressed' header flag, see MreRecord.HeaderFlags
+    _COMPRESSED_FLAG = 0x00040000
 
     def __init__(self, recType=b'TES4', blob_size=0, arg1=0, arg2=0, arg3=0,
                  arg4=0, *, _entering_context=False, ins=None):
@@ -101,6 +112,13 @@ def __init__(self, recType=b'TES4', blob_size=0, arg1=0, arg2=0, arg3=0,
         self.flags2 = arg3
         self.extra = arg4
 
+    @classmethod
+    def is_compressed(cls, flags1: int) -> bool:
+        """Check whether the specified record header flags (either a raw int
+        or a HeaderFlags instance) have the 'compressed' flag set, without
+        having to wrap raw flags in a HeaderFlags instance."""
+        return bool(int(flags1) & cls._COMPRESSED_FLAG)
+
     def pack_head(self, __rh=RecordHeader):
         """Return the record header packed into a bitstream to be written to
         file."""
@@ -275,9 +293,15 @@ def load_tes4(self, do_unpack_tes4=True):
         self.plugin_header.fid = tes4_rec_header.fid = ZERO_FID
 
     @classmethod
-    def from_info(cls, mod_info):
-        """Boilerplate for creating a ModReader wrapping a mod_info."""
-        return cls(mod_info.fn_key, mod_info.abs_path.open('rb'))
+    def from_info(cls, mod_info, *, in_memory=False):
+        """Boilerplate for creating a ModReader wrapping a mod_info. If
+        in_memory is True, read the whole plugin into memory up front - much
+        faster for scans that walk the entire file anyways."""
+        if in_memory:
+            with mod_info.abs_path.open('rb') as ins:
+                return cls(mod_info.fn_key, BytesIO(ins.read()))
+        return cls(mod_info.fn_key, mod_info.abs_path.open('rb',
+            buffering=_PLUGIN_BUFFER_SIZE))
 
     def setStringTable(self, string_table):
         self.hasStrings = bool(string_table)
@@ -321,14 +345,15 @@ def atEnd(self, endPos=-1, *debug_strs):
             return filePos == endPos
 
     #--Read/Unpack ----------------------------------------
-    def read(self, size, *debug_strs, file_offset=None):
+    def read(self, size, *debug_strs):
         """Read from file."""
-        endPos = (file_offset if file_offset is not None else self.ins.tell()
-                  ) + size
-        if endPos > self.size:
-            target_size = size - (endPos - self.size)
-            raise ModSizeError(self.inName, debug_strs, (target_size,), size)
-        return self.ins.read(size)
+        # Read first and check afterwards - a short read means we hit the end
+        # of the stream, so we don't have to tell() before every read
+        read_data = self.ins.read(size)
+        if len(read_data) < size:
+            raise ModSizeError(self.inName, debug_strs, (len(read_data),),
+                               size)
+        return read_data
 
     def readLString(self, size, *debug_strs, __unpacker=int_unpacker):
         """Read translatable string. If the mod has STRINGS files, this is a
@@ -351,8 +376,12 @@ def readString32(self, *debug_str, __unpacker=int_unpacker):
 
     def readString(self, size, *debug_strs):
         """Read string from file, stripping zero terminator."""
+        str_data = bolt.cstrip(self.read(size, *debug_strs))
+        # Fast path for pure ASCII strings, by far the most common case
+        if str_data.isascii():
+            return str_data.decode('ascii')
         return u'\n'.join(decoder(x,bolt.pluginEncoding,avoidEncodings=(u'utf8',u'utf-8')) for x in
-                          bolt.cstrip(self.read(size, *debug_strs)).split(b'\n'))
+                          str_data.split(b'\n'))
 
     def readStrings(self, size, *debug_strs):
         """Read strings from file, stripping zero terminator."""
@@ -362,10 +391,12 @@ def readStrings(self, size, *debug_strs):
     def unpack(self, struct_unpacker, size, *debug_strs):
         """Read size bytes from the file and unpack according to format of
         struct_unpacker."""
-        endPos = self.ins.tell() + size
-        if endPos > self.size:
-            raise ModReadError(self.inName, debug_strs, endPos, self.size)
-        return struct_unpacker(self.ins.read(size))
+        read_data = self.ins.read(size)
+        if len(read_data) < size:
+            raise ModReadError(self.inName, debug_strs,
+                               self.ins.tell() - len(read_data) + size,
+                               self.size)
+        return struct_unpacker(read_data)
 
     def __repr__(self):
         return f'{type(self).__name__}({self.inName})'
@@ -432,7 +463,8 @@ def __enter__(self, __head_unpack=unpack_header):
         utils_constants.short_mapper = self._get_short_mapper()
         utils_constants.short_mapper_no_engine = self._get_short_mapper(
             skip_engine=True)
-        self.__out = self._out_path and open(self._out_path, 'wb')
+        self.__out = self._out_path and open(self._out_path, 'wb',
+            buffering=_PLUGIN_BUFFER_SIZE)
         return self.__out
 
     def __exit__(self, exc_type, exc_value, exc_traceback):
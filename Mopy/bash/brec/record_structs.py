@@ -30,9 +30,11 @@
 from typing import Self
 
 from . import utils_constants
-from .basic_elements import SubrecordBlob, unpackSubHeader
-from .mod_io import ModReader, RecordHeader
-from .utils_constants import int_unpacker
+from .basic_elements import Subrecord, SubrecordBlob, split_defaults, \
+    unpackSubHeader
+from .mod_io import MAX_DECOMPRESS_BUFSIZE, ModReader, RecHeader, \
+    RecordHeader
+from .utils_constants import immutable_types, int_unpacker
 from .. import bolt, exception
 from ..bolt import decoder, flag, float_or_none, int_or_zero, sig_to_str, \
     str_or_none, struct_pack
@@ -130,16 +132,21 @@ def _str_to_bool(value, __falsy=frozenset(
     'weight': [float_or_none, _('Weight')],
 }
 
-# Note: these two formats *must* remain in the %d/%s style! f-strings will
-# break with Flags etc. due to them not implementing __format__
+# Note: the int format *must* remain in the %d style! f'{x:d}' will break
+# with Flags etc. due to them not implementing __format__ (and is slower).
+# An empty format spec falls back to str(), so f-strings are fine (and
+# faster) for the rest - this also covers floats, which should be wrapped
+# in Rounder (see __str__)
+def _int_to_csv(x):
+    return '"%d"' % x
+def _str_to_csv(x):
+    return f'"{x}"'
+def _none_or_int_to_csv(x):
+    return '"None"' if x is None else '"%d"' % x
 for _k, _v in attr_csv_struct.items():
-    if _v[0] is int_or_zero: # should also cover Flags
-        _v.append(lambda x: '"%d"' % x)
-    else: # also covers floats which should be wrapped in Rounder (see __str__)
-        _v.append(lambda x: '"%s"' % x)
+    _v.append(_int_to_csv if _v[0] is int_or_zero else _str_to_csv)
 del _k, _v
-attr_csv_struct[u'enchantPoints'][2] = lambda x: ( # can be None
-    '"None"' if x is None else f'"{x:d}"')
+attr_csv_struct['enchantPoints'][2] = _none_or_int_to_csv # can be None
 
 #------------------------------------------------------------------------------
 # Mod Element Sets ------------------------------------------------------------
@@ -168,9 +175,10 @@ def __init__(self,*elements):
     def getSlotsUsed(self):
         """This function returns all of the attributes used in record instances
         that use this instance."""
-        # Use a set to discard duplicates - saves memory!
-        return list({s for element in self.elements
-                     for s in element.getSlotsUsed()})
+        # Use a dict to discard duplicates (saves memory!) while keeping the
+        # slot order stable across runs
+        return list(dict.fromkeys([s for element in self.elements
+                                   for s in element.getSlotsUsed()]))
 
     def check_duplicate_attrs(self, curr_rec_sig):
         """This will raise a SyntaxError if any record attributes occur in more
@@ -195,27 +203,38 @@ def getDefault(self,attr):
         MelGroup and MelGroups."""
         return self.defaulters[attr].getDefault()
 
+    @bolt.fast_cached_property
+    def record_defaults(self):
+        """Split our elements into the ones that always set the very same
+        default values, which we can set on new records via a flat sequence
+        of (attr, value) pairs, and the ones that must create fresh defaults
+        (e.g. lists or flags) every time - see split_defaults."""
+        const_defaults, dynamic_elements = split_defaults(self.elements)
+        return tuple(const_defaults.items()), dynamic_elements
+
     def dumpData(self,record, out):
         """Dumps state into out. Called by getSize()."""
-        for element in self.elements:
-            try:
-                element.dumpData(record,out)
-            except:
-                bolt.deprint(u'Error dumping data: ', traceback=True)
-                bolt.deprint(u'Occurred while dumping '
-                             u'<%(eid)s[%(signature)s:%(fid)s]>' % {
-                    u'signature': record.rec_str,
-                    u'fid': f'{record.fid}',
-                    u'eid': (record.eid + u' ') if getattr(record, u'eid',
-                                                           None) else u'',
-                })
-                bolt.deprint('element:', element)
-                bolt.deprint('record flags:', getattr(record, 'flags1', None))
-                for attr in record.__slots__:
-                    attr1 = getattr(record, attr, None)
-                    if attr1 is not None:
-                        bolt.deprint(u'> %s: %r' % (attr, attr1))
-                raise
+        # A single try around the loop - element is still bound to the
+        # element that failed when we end up in the except
+        try:
+            for element in self.elements:
+                element.dumpData(record, out)
+        except:
+            bolt.deprint(u'Error dumping data: ', traceback=True)
+            bolt.deprint(u'Occurred while dumping '
+                         u'<%(eid)s[%(signature)s:%(fid)s]>' % {
+                u'signature': record.rec_str,
+                u'fid': f'{record.fid}',
+                u'eid': (record.eid + u' ') if getattr(record, u'eid',
+                                                       None) else u'',
+            })
+            bolt.deprint('element:', element)
+            bolt.deprint('record flags:', getattr(record, 'flags1', None))
+            for attr in record.__slots__:
+                attr1 = getattr(record, attr, None)
+                if attr1 is not None:
+                    bolt.deprint(u'> %s: %r' % (attr, attr1))
+            raise
 
     def mapFids(self, record, mapper, save_fids=False):
         """Maps fids of subelements."""
@@ -283,7 +302,7 @@ class MreRecord(metaclass=RecordType):
     header flags:
     https://github.com/wrye-bash/wrye-bash/wiki/%5Bdev%5D-Record-Header-Flags
     """
-    __slots__ = ('header', '_rec_sig', 'fid', 'flags1', 'changed', 'data',
+    __slots__ = ('header', '_rec_sig', 'fid', '_flags1', 'changed', 'data',
                  'inName')
     subtype_attr = {b'EDID': u'eid', b'FULL': u'full', b'MODL': u'model'}
     isKeyedByEid = False
@@ -304,16 +323,15 @@ def __init__(self, header, ins=None, *, do_unpack=True):
         self.header = header # type: RecHeader
         self._rec_sig: bytes = header.recType
         self.fid: utils_constants.FormId = header.fid
-        flags1_class = RecordType.sig_to_class[self._rec_sig].HeaderFlags
-        self.flags1: MreRecord.HeaderFlags = flags1_class(header.flags1)
+        # Wrapped in HeaderFlags on first access, see flags1 below
+        self._flags1: int | MreRecord.HeaderFlags = int(header.flags1)
         self.changed: bool = False
         self.data: bytes | None = None
         self.inName: str | None = ins and ins.inName
         if ins: # Load data from ins stream
             file_offset = ins.tell()
             ##: Couldn't we toss this data if we unpacked it? (memory!)
-            self.data = ins.read(header.blob_size, self._rec_sig,
-                                 file_offset=file_offset)
+            self.data = ins.read(header.blob_size, self._rec_sig)
             if not do_unpack: return  #--Read, but don't analyze.
             if self.__class__ is MreRecord: return  # nothing to be done
             ins_ins, ins_size = ins.ins, ins.size
@@ -326,6 +344,19 @@ def __init__(self, header, ins=None, *, do_unpack=True):
                 ins.ins, ins.size = ins_ins, ins_size
                 ins.debug_offset = ins_debug_offset
 
+    @property
+    def flags1(self) -> HeaderFlags:
+        """The record header flags. Most records never have their flags
+        inspected, so we only create the HeaderFlags instance when needed."""
+        if type(flags := self._flags1) is int:
+            flags_class = RecordType.sig_to_class[self._rec_sig].HeaderFlags
+            self._flags1 = flags = flags_class(flags)
+        return flags
+
+    @flags1.setter
+    def flags1(self, new_flags: HeaderFlags):
+        self._flags1 = new_flags
+
     @classmethod
     def nested_records_sigs(cls):
         return set()
@@ -377,10 +408,13 @@ def keep_fids(self, keep_plugins):
     def getDecompressed(self, *, __unpacker=int_unpacker):
         """Return (decompressed if necessary) record data wrapped in BytesIO.
         Return also the length of the data."""
-        if not self.flags1.compressed:
+        if not RecHeader.is_compressed(self._flags1):
             return io.BytesIO(self.data), len(self.data)
         decompressed_size, = __unpacker(self.data[:4])
-        decomp = zlib.decompress(self.data[4:])
+        # Skip the slice copy and let zlib allocate the output buffer in one
+        # go - capped, see MAX_DECOMPRESS_BUFSIZE
+        decomp = zlib.decompress(memoryview(self.data)[4:], bufsize=min(
+            decompressed_size, MAX_DECOMPRESS_BUFSIZE))
         if len(decomp) != decompressed_size:
             raise exception.ModError(self.inName,
                 f'Mis-sized compressed data. Expected {decompressed_size}, '
@@ -404,8 +438,11 @@ def iterate_subrecords(self, mel_sigs=frozenset()):
         with ModReader(self.inName, *self.getDecompressed()) as reader:
             _rec_sig_ = self._rec_sig
             readAtEnd = reader.atEnd
+            # Slice the subrecords out of the record data - getvalue does not
+            # copy, we never write to it. mel_data stays bytes
+            rec_data = reader.ins.getvalue()
             while not readAtEnd(reader.size,_rec_sig_):
-                subrec = SubrecordBlob(reader, _rec_sig_, mel_sigs)
+                subrec = SubrecordBlob(reader, _rec_sig_, mel_sigs, rec_data)
                 if not mel_sigs or subrec.mel_sig in mel_sigs:
                     yield subrec
 
@@ -428,7 +465,7 @@ def getSize(self):
         self._sort_subrecords()
         self.dumpData(out)
         self.data = out.getvalue()
-        if self.flags1.compressed:
+        if RecHeader.is_compressed(self._flags1):
             dataLen = len(self.data)
             comp = zlib.compress(self.data,6)
             self.data = struct_pack('=I', dataLen) + comp
@@ -463,7 +500,7 @@ def dump(self,out):
             raise exception.StateError(
                 f'Data undefined: {self.rec_str} {self.fid}')
         #--Update the header so it 'packs' correctly
-        self.header.flags1 = self.flags1
+        self.header.flags1 = self._flags1
         self.header.fid = self.fid
         out.write(self.header.pack_head())
         if self.header.blob_size > 0: out.write(self.data)
@@ -513,13 +550,25 @@ def __init__(self, header, ins=None, *, do_unpack=True):
         if self.__class__.rec_sig != header.recType:
             raise ValueError(f'Initialize {type(self)} with header.recType '
                              f'{header.recType}')
-        for element in self.__class__.melSet.elements:
+        const_defaults, dynamic_elements = \
+            self.__class__.melSet.record_defaults
+        for attr, default_val in const_defaults:
+            setattr(self, attr, default_val)
+        for element in dynamic_elements:
             element.setDefault(self)
         MreRecord.__init__(self, header, ins, do_unpack=do_unpack)
 
-    def getTypeCopy(self):
+    def getTypeCopy(self, *, __deepcopy=copy.deepcopy,
+                    __immutable=immutable_types):
         """Return a copy of self - we must be loaded, data will be discarded"""
-        myCopy = copy.deepcopy(self)
+        # Equivalent to copy.deepcopy(self), but skips deepcopy for the
+        # (many) immutable attribute values
+        cls = type(self)
+        myCopy = cls.__new__(cls)
+        memo = {id(self): myCopy}
+        for attr, val in self.__getstate__()[1].items():
+            setattr(myCopy, attr, val if type(val) in __immutable else
+                    __deepcopy(val, memo))
         myCopy.changed = True
         myCopy.data = None
         return myCopy
@@ -536,19 +585,28 @@ def getDefault(cls, attr):
         MelGroup and MelGroups."""
         return cls.melSet.getDefault(attr)
 
-    def loadData(self, ins, endPos, *, file_offset=0):
+    def loadData(self, ins, endPos, *, file_offset=0, __sr=Subrecord):
         """Loads data from input stream."""
         loaders = self.__class__.melSet.loaders
-        # Load each subrecord
+        rec_sig = self._rec_sig
+        # Load each subrecord - the subrecord header read is inlined from
+        # unpackSubHeader, which we only fall back on for the rare XXXX
         ins_at_end = ins.atEnd
-        while not ins_at_end(endPos, self._rec_sig):
-            sub_type, sub_size = unpackSubHeader(ins, self._rec_sig,
-                                                 file_offset=file_offset)
+        ins_unpack = ins.unpack
+        sh_unpack = __sr.sub_header_unpack
+        sh_size = __sr.sub_header_size
+        while not ins_at_end(endPos, rec_sig):
+            sub_type, sub_size = ins_unpack(sh_unpack, sh_size, rec_sig,
+                                            'SUB_HEAD')
+            if sub_type == b'XXXX':
+                ins.seek(-sh_size, 1)
+                sub_type, sub_size = unpackSubHeader(ins, rec_sig,
+                                                     file_offset=file_offset)
             try:
                 loader = loaders[sub_type]
                 try:
                     loader.load_mel(self, ins, sub_type, sub_size,
-                                    self._rec_sig, sub_type) # *debug_strs
+                                    rec_sig, sub_type) # *debug_strs
                     continue
                 except Exception as er:
                     error = er
@@ -30,7 +30,7 @@
 
 from .. import bolt, bush
 from ..bolt import Flags, attrgetter_cache, cstrip, decoder, flag, \
-    structs_cache, FName, fast_cached_property
+    structs_cache, FName, fast_cached_property, Rounder
 from ..exception import StateError
 
 # no local imports, imported everywhere in brec
@@ -121,13 +121,22 @@ def is_null(self):
         # Use object_dex instead of short_fid here since 01000000 is also NULL
         return self.object_dex == 0
 
-    # Hash and comparisons
+    # Hash and comparisons - __eq__/__ne__ are called for every fid attribute
+    # when comparing MelObjects, so they use try/except rather than the much
+    # slower contextlib.suppress. The hash is lazily cached like FName's, as
+    # hashing the long fid tuple calls back into FName.__hash__
     def __hash__(self):
-        return hash(self.long_fid)
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(self.long_fid)
+            return self._hash
 
     def __eq__(self, other):
-        with suppress(AttributeError):
+        try:
             return self.long_fid == other.long_fid
+        except AttributeError:
+            pass
         if other is None:
             return False
         elif isinstance(self.long_fid, type(other)):
@@ -135,8 +144,10 @@ def __eq__(self, other):
         return NotImplemented
 
     def __ne__(self, other):
-        with suppress(AttributeError):
+        try:
             return self.long_fid != other.long_fid
+        except AttributeError:
+            pass
         if other is None:
             return True
         elif isinstance(self.long_fid, type(other)):
@@ -325,7 +336,13 @@ class AutoFixedString(FixedString):
     """Variant of FixedString that uses chardet to detect encodings."""
     _str_encoding = None
 
+# Types of the most common record attribute values that are immutable, so
+# deepcopy would return them as is - used to skip it when copying records
+immutable_types = frozenset(
+    {bool, bytes, float, int, str, type(None), Rounder, FixedString})
+
 # Common flags ----------------------------------------------------------------
+
 class AMgefFlags(Flags):
     """Base class for MGEF data flags shared by all games."""
     hostile: bool = flag(0)
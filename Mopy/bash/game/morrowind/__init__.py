@@ -187,6 +187,7 @@ def init(cls, _package_name=None):
         sub = _brec_.Subrecord
         sub.sub_header_fmt = '=4sI'
         sub.sub_header_unpack = _struct.Struct(sub.sub_header_fmt).unpack
+        sub.sub_header_pack = _struct.Struct(sub.sub_header_fmt).pack
         sub.sub_header_size = 8
         cls._import_records(__name__)
 
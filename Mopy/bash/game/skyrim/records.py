@@ -411,6 +411,9 @@ def setDefault(self, record, *, __nones=repeat(None)):
         record.version = 1.71 if has_171 else 1.7
         record.nextObject = 0x001 if has_171 else 0x800
 
+    def constant_defaults(self):
+        return None
+
 class MreTes4(AMreHeader):
     """TES4 Record.  File header."""
     rec_sig = b'TES4'
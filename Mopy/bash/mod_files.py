@@ -30,11 +30,11 @@
 
 from . import bolt, bush, env
 from .bolt import MasterSet, SubProgress, decoder, deprint, sig_to_str, \
-    struct_error, GPath_no_norm, FName, unpack_int
+    struct_error, structs_cache, GPath_no_norm, FName, unpack_int
 # first import of brec for games with patchers - _dynamic_import_modules
-from .brec import ZERO_FID, FastModReader, FormIdReadContext, \
-    FormIdWriteContext, MobBase, ModReader, MreRecord, RecHeader, \
-    RecordHeader, RecordType, Subrecord, TopGrup, int_unpacker, null1, \
+from .brec import MAX_DECOMPRESS_BUFSIZE, ZERO_FID, FastModReader, \
+    FormIdReadContext, FormIdWriteContext, MobBase, ModReader, MreRecord, \
+    RecHeader, RecordHeader, RecordType, Subrecord, TopGrup, null1, \
     unpack_header, FormId, SubrecordBlob
 from .exception import MasterMapError, ModError, ModReadError, StateError
 from .wbtemp import TempFile
@@ -410,8 +410,9 @@ def extract_mod_data(mod_info, progress) -> _ModDataDict:
         # now - on py3.12 it is *slower*, even though it really should be
         # faster!
         plugin_fn = mod_info.fn_key
-        sh_unpack = Subrecord.sub_header_unpack
+        sh_unpack_from = structs_cache[Subrecord.sub_header_fmt].unpack_from
         sh_size = Subrecord.sub_header_size
+        int_unpack_from = structs_cache['=I'].unpack_from
         main_progress_msg = _('Loading: %(loading_plugin)s') % {
             'loading_plugin': plugin_fn}
         # Where we'll store all the collected record data
@@ -457,12 +458,14 @@ def extract_mod_data(mod_info, progress) -> _ModDataDict:
                     # This is a regular record, look for the EDID subrecord
                     eid = ''
                     blob_siz = next_header.blob_size
-                    next_record = ins_tell() + blob_siz
-                    if next_header.flags1 & 0x00040000: # 'compressed' flag
+                    rec_pos = ins_tell()
+                    next_record = rec_pos + blob_siz
+                    if RecHeader.is_compressed(next_header.flags1):
                         size_check = unpack_int(ins)
                         try:
-                            new_rec_data = zlib_decompress(ins_read(
-                                blob_siz - 4))
+                            rec_data = zlib_decompress(ins_read(blob_siz - 4),
+                                bufsize=min(size_check,
+                                            MAX_DECOMPRESS_BUFSIZE))
                         except zlib_error:
                             if plugin_fn == 'FalloutNV.esm':
                                 # Yep, FalloutNV.esm has a record with broken
@@ -470,41 +473,46 @@ def extract_mod_data(mod_info, progress) -> _ModDataDict:
                                 ins_seek(next_record)
                                 continue
                             raise
-                        if len(new_rec_data) != size_check:
+                        if len(rec_data) != size_check:
                             raise ModError(ins.inName,
                                 f'Mis-sized compressed data. Expected '
-                                f'{size_check}, got {len(new_rec_data)}.')
+                                f'{size_check}, got {len(rec_data)}.')
+                        rec_pos = 0
+                        rec_end = size_check
                     else:
-                        new_rec_data = ins_read(blob_siz)
-                    fmr = FastModReader(plugin_fn, new_rec_data)
-                    fmr_seek = fmr.seek
-                    fmr_read = fmr.read
-                    fmr_tell = fmr.tell
-                    fmr_size = fmr.size
-                    while fmr_tell() != fmr_size:
-                        # Inlined from unpackSubHeader & FastModReader.unpack
-                        read_data = fmr_read(sh_size)
-                        if len(read_data) != sh_size:
-                            raise ModReadError(
-                                plugin_fn, [_rsig, 'SUB_HEAD'],
-                                fmr_tell() - len(read_data), fmr_size)
-                        mel_sig, mel_size = sh_unpack(read_data)
+                        # Scan the record right inside the plugin's bytes, no
+                        # need to copy it out first
+                        rec_data = initial_bytes
+                        rec_end = next_record
+                    while rec_pos != rec_end:
+                        # Inlined from unpackSubHeader
+                        if rec_pos + sh_size > rec_end:
+                            raise ModReadError(plugin_fn, [_rsig, 'SUB_HEAD'],
+                                               rec_pos, rec_end)
+                        mel_sig, mel_size = sh_unpack_from(rec_data, rec_pos)
+                        rec_pos += sh_size
                         # Extended storage - very rare, so don't optimize
                         # inlines etc. for it
                         if mel_sig == b'XXXX':
                             # Throw away size here (always == 0)
-                            mel_size = fmr.unpack(int_unpacker, 4, _rsig,
-                                                  'XXXX.SIZE')[0]
-                            mel_sig = fmr.unpack(sh_unpack, sh_size, _rsig,
-                                                 'XXXX.TYPE')[0]
+                            mel_size = int_unpack_from(rec_data, rec_pos)[0]
+                            rec_pos += 4
+                            mel_sig = sh_unpack_from(rec_data, rec_pos)[0]
+                            rec_pos += sh_size
                         if mel_sig == b'EDID':
                             # No need to worry about newlines, these are Editor
-                            # IDs and so won't contain any
-                            eid = decoder(fmr_read(mel_size).rstrip(null1),
-                                          wanted_encoding, avoided_encodings)
+                            # IDs and so won't contain any. They are almost
+                            # always pure ASCII too, so skip the heuristics of
+                            # decoder for those
+                            eid = rec_data[rec_pos:rec_pos + mel_size].rstrip(
+                                null1)
+                            if eid.isascii():
+                                eid = eid.decode('ascii')
+                            else:
+                                eid = decoder(eid, wanted_encoding,
+                                              avoided_encodings)
                             break
-                        else:
-                            fmr_seek(mel_size, 1)
+                        rec_pos += mel_size
                     record_list.append((next_header, eid))
                     ins_seek(next_record) # we may have break'd at EDID
         del group_records[bush.game.Esp.plugin_header_sig] # skip TES4 record
@@ -513,38 +521,40 @@ def extract_mod_data(mod_info, progress) -> _ModDataDict:
     ##: The methods above have to be very fast, but this one can afford to be
     # much slower. Should eventually be absorbed by refactored ModFile API.
     @staticmethod
-    def read_temp_child_headers(mod_info) -> list[RecHeader]:
+    def read_temp_child_headers(mod_info, *,
+            __interested_sigs=frozenset((b'CELL', b'WRLD')),
+            __skipped_grup_types=frozenset((7, 8))) -> list[RecHeader]:
         """Reads the headers of all temporary CELL chilren in the specified mod
         and returns them as a list. Used for determining FO3/FNV/TES5 ONAM."""
         ret_headers = []
         # We want to read only the children of these, so skip their tops
-        interested_sigs = {b'CELL', b'WRLD'}
+        interested_sigs = __interested_sigs
         tops_to_skip = interested_sigs | {bush.game.Esp.plugin_header_sig}
         with FormIdReadContext.from_info(mod_info) as ins:
             ins_at_end = ins.atEnd
+            ins_seek = ins.seek
             try:
                 while not ins_at_end():
                     next_header = unpack_header(ins)
                     header_rec_sig = next_header.recType
                     if header_rec_sig == b'GRUP':
-                        header_group_type = next_header.groupType
                         # Skip all top-level GRUPs we're not interested in
                         # (group type == 0) and all persistent children and
                         # dialog topics (group type == 7 or 8, respectively).
                         if ((next_header.is_top_group_header and
                              next_header.label not in interested_sigs)
-                                or header_group_type in (7, 8)):
+                                or next_header.groupType in
+                                __skipped_grup_types):
                             # Note that GRUP sizes include their own header
-                            # size, so we need to subtract that
-                            next_header.skip_blob(ins)
-                    elif header_rec_sig in tops_to_skip:
-                        # Skip TES4, CELL and WRLD to get to their contents
-                        next_header.skip_blob(ins)
-                    else:
-                        # We must be in a temp CELL children group, store the
-                        # header and skip the record body
+                            # size, blob_size subtracts that for us
+                            ins_seek(next_header.blob_size, 1)
+                        continue
+                    # Skip TES4, CELL and WRLD to get to their contents -
+                    # otherwise we must be in a temp CELL children group, so
+                    # store the header. Skip the record body in both cases
+                    if header_rec_sig not in tops_to_skip:
                         ret_headers.append(next_header)
-                        next_header.skip_blob(ins)
+                    ins_seek(next_header.blob_size, 1, header_rec_sig)
             except (OSError, struct_error) as e:
                 msg = f'Error scanning {mod_info}, file read pos: {ins.tell()}'
                 raise ModError(ins.inName, msg) from e
@@ -557,7 +567,7 @@ def read_all_subrecords(mod_info) -> \
         tuples of record headers and the subrecords those headers contain."""
         ret_records = defaultdict(list)
         curr_sig = None
-        with FormIdReadContext.from_info(mod_info) as ins:
+        with FormIdReadContext.from_info(mod_info, in_memory=True) as ins:
             try:
                 while not ins.atEnd():
                     next_header = unpack_header(ins)
@@ -779,10 +779,10 @@ def _parse_line(self, csv_fields):
     def _row_out(self, lfid, stored_data, top_grup):
         """Exports faction relations to specified text file."""
         rel, main_eid = stored_data
+        sers = [attr_csv_struct[a][2] for a in self.__class__.array_item_attrs]
         return '\n'.join(['"%s",%s,"%s",%s,%s' % (
             main_eid, _fid_str(lfid), oth_eid, _fid_str(oth_fid), ','.join(
-                attr_csv_struct[a][2](x) for a, x in
-                zip(self.__class__.array_item_attrs, relation_obj)))
+                ser(x) for ser, x in zip(sers, relation_obj)))
         for oth_fid, (relation_obj, oth_eid) in self._row_sorter(rel)]) + '\n'
 
 #------------------------------------------------------------------------------
@@ -28,6 +28,7 @@
 import copy
 from collections import Counter, defaultdict
 from itertools import chain
+from operator import attrgetter
 
 from ..base import ImportPatcher, ListPatcher
 from ... import bush, load_order
@@ -70,7 +71,9 @@ def __init__(self, p_name, p_file, p_sources):
     def _entry_key(self, subrecord_entry):
         """Returns a key to sort and compare by for the specified subrecord
         entry. Default implementation returns the entry itself (useful if the
-        subrecord is e.g. just a list of FormIDs)."""
+        subrecord is e.g. just a list of FormIDs). Subclasses keying on an
+        attribute of the entries use an attrgetter instead, since this is
+        called for every entry when computing the deltas."""
         return subrecord_entry
 
     @property
@@ -255,9 +258,7 @@ class ImportActorsPerksPatcher(_AMerger):
     _remove_tag = 'NPC.Perks.Remove'
     _wanted_subrecord = {x: 'npc_perks' for x in bush.game.actor_types}
     patcher_tags = {'NPC.Perks.Add', 'NPC.Perks.Change', 'NPC.Perks.Remove'}
-
-    def _entry_key(self, subrecord_entry):
-        return subrecord_entry.npc_perk_fid
+    _entry_key = attrgetter('npc_perk_fid')
 
 #------------------------------------------------------------------------------
 class ImportInventoryPatcher(_AMerger):
@@ -268,9 +269,7 @@ class ImportInventoryPatcher(_AMerger):
     _wanted_subrecord = {x: 'items' for x in bush.game.inventory_types}
     iiMode = True
     patcher_tags = {'Invent.Add', 'Invent.Change', 'Invent.Remove'}
-
-    def _entry_key(self, subrecord_entry):
-        return subrecord_entry.item
+    _entry_key = attrgetter('item')
 
 #------------------------------------------------------------------------------
 class ImportOutfitsPatcher(_AMerger):
@@ -289,9 +288,7 @@ class ImportRacesRelationsPatcher(_AMerger):
     _wanted_subrecord = {b'RACE': 'relations'}
     patcher_tags = {'R.Relations.Add', 'R.Relations.Change',
                     'R.Relations.Remove'}
-
-    def _entry_key(self, subrecord_entry):
-        return subrecord_entry.faction
+    _entry_key = attrgetter('faction')
 
 #------------------------------------------------------------------------------
 class ImportRelationsPatcher(_AMerger):
@@ -302,9 +299,7 @@ class ImportRelationsPatcher(_AMerger):
     _wanted_subrecord = {b'FACT': 'relations'}
     patcher_tags = {'Relations.Add', 'Relations.Change', 'Relations.Remove'}
     # _csv_key = 'Relations' # TODO restore csv support
-
-    def _entry_key(self, subrecord_entry):
-        return subrecord_entry.faction
+    _entry_key = attrgetter('faction')
 
 #------------------------------------------------------------------------------
 # Patchers to absorb ----------------------------------------------------------
@@ -129,6 +129,7 @@ class _AGmstTweak(_ASettingsTweak):
     """Sets a GMST to specified value."""
     tweak_read_classes = b'GMST',
     _eid_was_itpo: dict[str, bool]
+    _lower_eid_data: dict[str, tuple]
 
     def __init__(self, bashed_patch):
         super().__init__(bashed_patch)
@@ -176,21 +177,33 @@ def eid_was_itpo(self):
             self._eid_was_itpo = {e.lower(): False for e in self.chosen_eids}
             return self._eid_was_itpo
 
+    @property
+    def _lower_eid_choices(self):
+        """Maps the lower-cased editor IDs of our game settings to their
+        original case and the value the user chose for them - lower-cased once
+        here rather than on every lookup."""
+        try:
+            return self._lower_eid_data
+        except AttributeError:
+            self._lower_eid_data = {e.lower(): (e, v) for e, v in reversed(
+                [*zip(self.chosen_eids, self.chosen_values)])}
+            return self._lower_eid_data
+
     def _find_chosen_value(self, wanted_eid):
         """Returns the value the user chose for the game setting with the
         specified editor ID. Note that wanted_eid must be lower-case!"""
-        for test_eid, test_val in zip(self.chosen_eids, self.chosen_values):
-            if wanted_eid == test_eid.lower():
-                return test_val
-        return None
+        try:
+            return self._lower_eid_choices[wanted_eid][1]
+        except KeyError:
+            return None
 
     def _find_original_eid(self, lower_eid):
         """We need to find the original case of the EDID, otherwise getFMSTFid
         blows - plus the dumped record will look nicer :)."""
-        for orig_eid in self.chosen_eids:
-            if lower_eid == orig_eid.lower():
-                return orig_eid
-        return lower_eid # fallback, should never happen
+        try:
+            return self._lower_eid_choices[lower_eid][0]
+        except KeyError:
+            return lower_eid # fallback, should never happen
 
     def validate_values(self, chosen_values: tuple) -> str | None:
         if bush.game.fsName == 'Oblivion': ##: add a comment why TES4 only!
@@ -478,6 +478,10 @@ def test__eq__(self):
         assert not (rounder_5th == True)
         assert not (rounder_5th == 55)
 
+    def test_copy(self):
+        r = Rounder(1.00001)
+        assert copy.copy(r) is copy.deepcopy(r) is r # immutable
+
 class TestLooseVersion:
     def test_repr(self):
         """Tests that parsing and __repr__ work correctly."""
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+#
+# GPL License and Copyright Notice ============================================
+#  This file is part of Wrye Bash.
+#
+#  Wrye Bash is free software: you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation, either version 3
+#  of the License, or (at your option) any later version.
+#
+#  Wrye Bash is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Wrye Bash.  If not, see <https://www.gnu.org/licenses/>.
+#
+#  Wrye Bash copyright (C) 2005-2009 Wrye, 2010-2024 Wrye Bash Team
+#  https://github.com/wrye-bash
+#
+# =============================================================================
+"""Tests for the BashTags file reading and writing in mods_metadata."""
+import pytest
+
+from ... import bass
+from ...bolt import FName, GPath
+from ...bosh.mods_metadata import get_tags_from_dir, save_tags_to_dir
+
+@pytest.fixture
+def tag_files_dir(tmp_path, monkeypatch):
+    """Points the BashTags dir at a temporary directory."""
+    monkeypatch.setitem(bass.dirs, 'tag_files', GPath(tmp_path))
+    return tmp_path
+
+class TestTagFiles:
+    _plugin = FName('Test Plugin.esp')
+
+    def _write_tags(self, tag_dir, tag_lines):
+        with open(tag_dir / 'Test Plugin.txt', 'w', encoding='utf-8') as out:
+            out.write('\n'.join(tag_lines))
+
+    def test_get_tags_from_dir(self, tag_files_dir):
+        self._write_tags(tag_files_dir, [
+            '# A comment on its own line',
+            'C.Water, Delev # a comment after some tags',
+            '',
+            'Relev,,Names',
+            '  ',
+            'Stats, ,Sound',
+            '-C.Light',
+            '- C.Music, -Invent.Add',
+            '#-C.Owner, Graphics',
+            '   # indented comment',
+        ])
+        added, removed = get_tags_from_dir(self._plugin)
+        assert added == {'C.Water', 'Delev', 'Relev', 'Names', 'Stats',
+                         'Sound'}
+        assert removed == {'C.Light', 'C.Music', 'Invent.Add'}
+
+    def test_get_tags_from_dir_missing(self, tag_files_dir):
+        assert get_tags_from_dir(self._plugin) == (set(), set())
+        assert get_tags_from_dir(self._plugin,
+                                 ci_cached_bt_contents=set()) == (set(), set())
+
+    def test_get_tags_from_dir_cached(self, tag_files_dir):
+        self._write_tags(tag_files_dir, ['Delev', '-Relev'])
+        assert get_tags_from_dir(self._plugin, ci_cached_bt_contents={
+            'test plugin.txt'}) == ({'Delev'}, {'Relev'})
+
+    def test_save_tags_to_dir(self, tag_files_dir):
+        save_tags_to_dir(self._plugin, ({'Delev', 'C.Water', 'Stats'},
+                                        {'Relev', 'Actors.AIData', 'Names'}))
+        with open(tag_files_dir / 'Test Plugin.txt', encoding='utf-8') as ins:
+            saved_lines = ins.read().splitlines()
+        assert saved_lines[0].startswith('# ')
+        # Removed tags sort as if the minus was not there
+        assert saved_lines[1:] == ['-Actors.AIData, C.Water, Delev, -Names, '
+                                   '-Relev, Stats']
+        # And reading them back gives us the same tags
+        assert get_tags_from_dir(self._plugin) == (
+            {'Delev', 'C.Water', 'Stats'}, {'Relev', 'Actors.AIData', 'Names'})